@@ -11,18 +11,30 @@ This version has additional error handling for better compatibility with differe
 Output format:
 - JSON: Structured output for automation systems and dashboards
 
+Device metadata:
+- Hostname, model, serial number and version from "show version" are cached per
+  switch in ~/.cache/net-tools/device-meta.sqlite for 24 hours, so later polls skip
+  that command. Use --refresh-metadata after an upgrade or replacement.
+
+Optional dependencies:
+- orjson: Faster JSON output for large results (falls back to json; non-ASCII text is
+  written as raw UTF-8 rather than \\u escapes)
+
 Parameters:
-  --host HOST - Target Arista EOS switch hostname or IP
+  --host HOST [HOST ...] - Target Arista EOS switch hostname(s) or IP(s)
   --username USERNAME - eAPI username
   --password PASSWORD - eAPI password
   --transport {http,https} - eAPI transport protocol (default: https)
   --port PORT - eAPI port (default: 443)
   --threshold THRESHOLD - Utilization threshold % to highlight (default: 70)
+  --concurrency N - Maximum switches polled at once with multiple hosts (default: 50)
+  --include-descriptions - Include interface descriptions (empty strings otherwise)
+  --refresh-metadata - Ignore cached device metadata and fetch it again
   --debug - Enable debug output
 
 Exit codes:
   0 - Success
-  1 - Error occurred
+  1 - Error occurred (with multiple hosts: at least one switch failed)
 
 Usage examples:
   Basic usage:
@@ -30,19 +42,157 @@ Usage examples:
 
   With HTTP instead of HTTPS:
     python arista-eos-port-utilization.py --host 10.1.1.1 --username admin --password arista --transport http --port 80
+
+  Include interface descriptions:
+    python arista-eos-port-utilization.py --host 10.1.1.1 --username admin --password arista --include-descriptions
+
+  Poll several switches concurrently (outputs a JSON list, one entry per host):
+    python arista-eos-port-utilization.py --host 10.1.1.1 10.1.1.2 10.1.1.3 --username admin --password arista
 """
 
 import sys
 import json
 import argparse
+import dataclasses
 import datetime
+import os
+import sqlite3
 import ssl
+import time
+import numpy as np
 import pyeapi
 
+# asyncio and aiohttp are imported by the multi-host functions that use them, so a
+# single-switch run does not pay for loading them
+
+try:
+    # orjson serializes large results several times faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
 # Disable SSL certification verification for compatibility with self-signed certificates
 ssl._create_default_https_context = ssl._create_unverified_context
 
-def get_port_utilization(connection, threshold=70, debug=False):
+# Shared read-only default for missing eAPI sections, avoiding a new dict per lookup
+_EMPTY = {}
+
+# Commands sent as one batched eAPI request; parsing indexes the results by position
+EOS_COMMANDS = [
+    "show version",
+    "show interfaces status",
+    "show interfaces counters",
+    "show interfaces counters rates",
+    "show interfaces counters errors",
+]
+
+# Appended to the batch only when descriptions are requested
+DESCRIPTION_COMMAND = "show interfaces description"
+
+# On-disk cache of "show version" fields, which do not change between polls
+DEVICE_META_PATH = os.path.expanduser("~/.cache/net-tools/device-meta.sqlite")
+DEVICE_META_FIELDS = ("hostname", "modelName", "serialNumber", "version")
+
+# Seconds before cached device metadata is queried again
+DEVICE_META_TTL = 24 * 3600
+
+_META_DB = None
+
+
+@dataclasses.dataclass
+class InterfaceUtilization:
+    """One interface entry of the report, serialized as a JSON object by print_json."""
+    __slots__ = (
+        "name", "description", "status", "bandwidth_mbps", "input_rate_mbps", "output_rate_mbps",
+        "input_utilization", "output_utilization", "input_errors", "output_errors", "high_utilization"
+    )
+    name: str
+    description: str
+    status: str
+    bandwidth_mbps: float
+    input_rate_mbps: float
+    output_rate_mbps: float
+    input_utilization: float
+    output_utilization: float
+    input_errors: int
+    output_errors: int
+    high_utilization: bool
+
+
+def eos_commands(include_descriptions=False, include_version=True):
+    """Return the batched eAPI command list, with the description command last when requested."""
+    commands = EOS_COMMANDS if include_version else EOS_COMMANDS[1:]
+    return commands + [DESCRIPTION_COMMAND] if include_descriptions else commands
+
+
+def _metadata_db():
+    """Open the device metadata cache, creating it on first use."""
+    global _META_DB
+    if _META_DB is None:
+        os.makedirs(os.path.dirname(DEVICE_META_PATH), exist_ok=True)
+        db = sqlite3.connect(DEVICE_META_PATH)
+        db.execute("CREATE TABLE IF NOT EXISTS device_meta (host TEXT PRIMARY KEY, updated REAL, data TEXT)")
+        _META_DB = db
+    return _META_DB
+
+
+def get_cached_metadata(host):
+    """Return the cached "show version" fields for host, or None when missing, expired or unreadable."""
+    try:
+        row = _metadata_db().execute(
+            "SELECT updated, data FROM device_meta WHERE host = ?", (host,)
+        ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None or time.time() - row[0] >= DEVICE_META_TTL:
+        return None
+    return json.loads(row[1])
+
+
+def cache_metadata(host, version_data):
+    """Store the static "show version" fields for host; cache write failures are ignored."""
+    data = {field: version_data[field] for field in DEVICE_META_FIELDS if field in version_data}
+    try:
+        with _metadata_db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO device_meta (host, updated, data) VALUES (?, ?, ?)",
+                (host, time.time(), json.dumps(data))
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def clear_metadata_cache(hosts):
+    """Drop cached metadata for hosts so the next poll runs "show version" again."""
+    try:
+        with _metadata_db() as db:
+            db.executemany("DELETE FROM device_meta WHERE host = ?", [(host,) for host in hosts])
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def _merge_metadata(host, cached, results):
+    """Put the version data back at the front of results, caching it when freshly fetched."""
+    if cached is None:
+        cache_metadata(host, results[0] or _EMPTY)
+        return results
+    return [cached] + results
+
+
+def utc_timestamp():
+    """Return the current UTC time as an ISO 8601 string with second precision."""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+
+
+def _to_number(value, cast=float):
+    """Convert an eAPI counter value with cast, treating malformed values as 0."""
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_port_utilization(connection, threshold=70, debug=False, include_descriptions=False):
     """
     Retrieve port statistics and calculate utilization for Arista EOS switches.
     
@@ -50,267 +200,356 @@ def get_port_utilization(connection, threshold=70, debug=False):
         connection: pyeapi connection object
         threshold (int): Utilization percentage threshold to highlight (default: 70)
         debug (bool): Enable debug output
+        include_descriptions (bool): Also fetch interface descriptions (default: False)
         
     Returns:
         dict: Structured port utilization data
     """
     try:
-        # Get device information with more robust error handling
+        # Fetch everything in a single eAPI request; results come back in command order.
+        # "show version" is skipped while its fields are cached on disk.
         if debug:
-            print("DEBUG: Fetching device information...", file=sys.stderr)
+            print("DEBUG: Fetching device and interface information...", file=sys.stderr)
 
-        show_version = connection.execute("show version")
-        if debug:
-            print(f"DEBUG: show version result: {json.dumps(show_version)}", file=sys.stderr)
-            
-        version_data = show_version["result"][0]
-        
-        # Set default values for device info
-        hostname = "Unknown"
-        model = "Unknown"
-        serial_number = "Unknown"
-        version = "Unknown"
-        
-        # Extract data with robust error handling
-        try:
-            hostname = version_data.get("hostname", "Unknown")
-        except (KeyError, TypeError):
-            pass
-            
-        try:
-            model = version_data.get("modelName", "Unknown")
-        except (KeyError, TypeError):
-            pass
-            
-        try:
-            serial_number = version_data.get("serialNumber", "Unknown")
-        except (KeyError, TypeError):
-            pass
-            
-        try:
-            version = version_data.get("version", "Unknown")
-        except (KeyError, TypeError):
-            pass
-            
-        # Use the host provided if hostname is not available
-        if hostname == "Unknown":
-            hostname = connection.transport.host
+        host = connection.transport.host
+        cached = get_cached_metadata(host)
+        response = connection.execute(eos_commands(include_descriptions, cached is None))
+        results = _merge_metadata(host, cached, response["result"])
+        return build_port_utilization(results, host, threshold, debug)
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve port utilization data: {str(e)}")
+
+
+async def get_port_utilization_async(session, host, username, password, transport="https", port=443, threshold=70, debug=False, include_descriptions=False, timestamp=None):
+    """
+    Retrieve port utilization for one switch by posting the batched eAPI request over aiohttp.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        host (str): Arista EOS switch hostname or IP
+        username (str): eAPI username
+        password (str): eAPI password
+        transport (str): eAPI transport protocol (default: https)
+        port (int): eAPI port (default: 443)
+        threshold (int): Utilization percentage threshold to highlight (default: 70)
+        debug (bool): Enable debug output
+        include_descriptions (bool): Also fetch interface descriptions (default: False)
+        timestamp (str, optional): Report timestamp shared by a polling round (default: now)
         
-        device_info = {
-            "hostname": hostname,
-            "platform": "Arista EOS",
-            "model": model,
-            "serial_number": serial_number,
-            "version": version
+    Returns:
+        dict: Structured port utilization data
+    """
+    import aiohttp
+    
+    try:
+        cached = get_cached_metadata(host)
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "runCmds",
+            "params": {"version": 1, "cmds": eos_commands(include_descriptions, cached is None), "format": "json"},
+            "id": host
         }
+        url = f"{transport}://{host}:{port}/command-api"
+
+        async with session.post(url, json=payload, auth=aiohttp.BasicAuth(username, password)) as resp:
+            resp.raise_for_status()
+            response = await resp.json(content_type=None)
+
+        if "error" in response:
+            raise RuntimeError(response["error"].get("message", "eAPI request failed"))
+
+        results = _merge_metadata(host, cached, response["result"])
+        return build_port_utilization(results, host, threshold, debug, timestamp)
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve port utilization data: {str(e)}")
+
+
+async def run_many(hosts, username, password, transport="https", port=443, threshold=70, concurrency=50, debug=False, include_descriptions=False):
+    """
+    Poll many switches concurrently over one shared aiohttp session.
+    
+    Args:
+        hosts (list): Arista EOS switch hostnames or IPs
+        username (str): eAPI username
+        password (str): eAPI password
+        transport (str): eAPI transport protocol (default: https)
+        port (int): eAPI port (default: 443)
+        threshold (int): Utilization percentage threshold to highlight (default: 70)
+        concurrency (int): Maximum number of switches polled at once (default: 50)
+        debug (bool): Enable debug output
+        include_descriptions (bool): Also fetch interface descriptions (default: False)
         
-        if debug:
-            print(f"DEBUG: Device info: {json.dumps(device_info)}", file=sys.stderr)
-            
-        # Get interface descriptions
-        if debug:
-            print("DEBUG: Fetching interface descriptions...", file=sys.stderr)
-            
-        show_interfaces_description = connection.execute("show interfaces description")
-        interface_descriptions = {}
+    Returns:
+        list: One result per host, in input order. Failed hosts are reported as
+              {"host": ..., "error": ..., "success": False}.
+    """
+    import asyncio
+    import aiohttp
+    
+    # One timestamp for the whole round so every switch reports the same snapshot time
+    timestamp = utc_timestamp()
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def poll(host):
+            async with semaphore:
+                try:
+                    return await get_port_utilization_async(
+                        session, host, username, password, transport, port, threshold, debug, include_descriptions, timestamp
+                    )
+                except Exception as e:
+                    return {"host": host, "error": str(e), "success": False}
+
+        return await asyncio.gather(*(poll(host) for host in hosts))
+
+
+def build_port_utilization(results, host, threshold=70, debug=False, timestamp=None):
+    """
+    Build the port utilization report from the batched eos_commands() results.
+    
+    Args:
+        results (list): eAPI results, one entry per command from eos_commands()
+        host (str): Switch address, used when the device reports no hostname
+        threshold (int): Utilization percentage threshold to highlight (default: 70)
+        debug (bool): Enable debug output
+        timestamp (str, optional): Report timestamp (default: now, from utc_timestamp())
         
-        try:
-            interface_descriptions = show_interfaces_description["result"][0].get("interfaceDescriptions", {})
-        except (KeyError, IndexError):
-            if debug:
-                print("DEBUG: Error parsing interface descriptions", file=sys.stderr)
+    Returns:
+        dict: Structured port utilization data; "interfaces" holds InterfaceUtilization records
+    """
+    if debug:
+        print(f"DEBUG: show version result: {json.dumps(results[0])}", file=sys.stderr)
+
+    # Missing fields default to "Unknown"
+    version_data = results[0] or _EMPTY
+    hostname = version_data.get("hostname", "Unknown")
+    model = version_data.get("modelName", "Unknown")
+    serial_number = version_data.get("serialNumber", "Unknown")
+    version = version_data.get("version", "Unknown")
+    
+    # Use the host provided if hostname is not available
+    if hostname == "Unknown":
+        hostname = host
+    
+    device_info = {
+        "hostname": hostname,
+        "platform": "Arista EOS",
+        "model": model,
+        "serial_number": serial_number,
+        "version": version
+    }
+    
+    if debug:
+        print(f"DEBUG: Device info: {json.dumps(device_info)}", file=sys.stderr)
         
-        # Get interface status
+    # Parse interface status
+    interface_status = {}
+    
+    try:
+        interface_status = results[1].get("interfaceStatuses", {})
+    except (KeyError, IndexError):
         if debug:
-            print("DEBUG: Fetching interface status...", file=sys.stderr)
-            
-        show_interfaces_status = connection.execute("show interfaces status")
-        interface_status = {}
-        
-        try:
-            interface_status = show_interfaces_status["result"][0].get("interfaceStatuses", {})
-        except (KeyError, IndexError):
-            if debug:
-                print("DEBUG: Error parsing interface status", file=sys.stderr)
-        
-        # Get interface counters
+            print("DEBUG: Error parsing interface status", file=sys.stderr)
+    
+    # Parse interface counters
+    interface_counters = {}
+    
+    try:
+        interface_counters = results[2].get("interfaces", {})
+    except (KeyError, IndexError):
         if debug:
-            print("DEBUG: Fetching interface counters...", file=sys.stderr)
-            
-        show_interfaces_counters = connection.execute("show interfaces counters")
-        interface_counters = {}
-        
-        try:
-            interface_counters = show_interfaces_counters["result"][0].get("interfaces", {})
-        except (KeyError, IndexError):
-            if debug:
-                print("DEBUG: Error parsing interface counters", file=sys.stderr)
-        
-        # Get interface rates
+            print("DEBUG: Error parsing interface counters", file=sys.stderr)
+    
+    # Parse interface rates
+    interface_rates = {}
+    
+    try:
+        interface_rates = results[3].get("interfaces", {})
+    except (KeyError, IndexError):
         if debug:
-            print("DEBUG: Fetching interface rates...", file=sys.stderr)
-            
-        show_interfaces_rates = connection.execute("show interfaces counters rates")
-        interface_rates = {}
-        
-        try:
-            interface_rates = show_interfaces_rates["result"][0].get("interfaces", {})
-        except (KeyError, IndexError):
-            if debug:
-                print("DEBUG: Error parsing interface rates", file=sys.stderr)
-        
-        # Get interface errors
+            print("DEBUG: Error parsing interface rates", file=sys.stderr)
+    
+    # Parse interface errors
+    interface_errors = {}
+    
+    try:
+        interface_errors = results[4].get("interfaceCounters", {})
+    except (KeyError, IndexError):
         if debug:
-            print("DEBUG: Fetching interface errors...", file=sys.stderr)
-            
-        show_interfaces_errors = connection.execute("show interfaces counters errors")
-        interface_errors = {}
-        
+            print("DEBUG: Error parsing interface errors", file=sys.stderr)
+    
+    # Parse interface descriptions, present only when DESCRIPTION_COMMAND was sent
+    interface_descriptions = {}
+    
+    if len(results) > len(EOS_COMMANDS):
         try:
-            interface_errors = show_interfaces_errors["result"][0].get("interfaceCounters", {})
-        except (KeyError, IndexError):
+            interface_descriptions = results[len(EOS_COMMANDS)].get("interfaceDescriptions", {})
+        except (KeyError, AttributeError):
             if debug:
-                print("DEBUG: Error parsing interface errors", file=sys.stderr)
-        
-        # Collect all Ethernet interfaces
-        interfaces = []
-        high_utilization_count = 0
-        error_interfaces_count = 0
-        active_interfaces_count = 0
-        
-        for interface_name, status in interface_status.items():
-            try:
-                # Only process Ethernet interfaces
-                if not interface_name.startswith("Ethernet"):
-                    continue
-                    
-                # Get interface description
-                description = ""
-                try:
-                    description = interface_descriptions.get(interface_name, {}).get("description", "")
-                except (TypeError, KeyError):
-                    pass
-                
-                # Get interface bandwidth
-                bandwidth_mbps = 0
-                try:
-                    bandwidth_mbps = int(status.get("bandwidth", 0)) / 1000000 if "bandwidth" in status else 0
-                except (TypeError, KeyError, ValueError):
-                    pass
-                
-                # Get interface status
-                oper_status = "unknown"
-                try:
-                    oper_status = status.get("linkStatus", "unknown")
-                except (TypeError, KeyError):
-                    pass
-                
-                # Only count active interfaces
-                if oper_status == "up":
-                    active_interfaces_count += 1
-                
-                # Get interface rates
-                input_rate_mbps = 0
-                output_rate_mbps = 0
-                
-                try:
-                    input_rate_mbps = float(interface_rates.get(interface_name, {}).get("inRate", 0)) if interface_name in interface_rates else 0
-                except (TypeError, KeyError, ValueError):
-                    pass
-                
-                try:
-                    output_rate_mbps = float(interface_rates.get(interface_name, {}).get("outRate", 0)) if interface_name in interface_rates else 0
-                except (TypeError, KeyError, ValueError):
-                    pass
-                
-                # Calculate utilization percentage
-                input_utilization = (input_rate_mbps / bandwidth_mbps * 100) if bandwidth_mbps > 0 else 0
-                output_utilization = (output_rate_mbps / bandwidth_mbps * 100) if bandwidth_mbps > 0 else 0
-                
-                # Check if utilization exceeds threshold
-                high_utilization = input_utilization > threshold or output_utilization > threshold
-                if high_utilization:
-                    high_utilization_count += 1
-                
-                # Get error counters
-                input_errors = 0
-                output_errors = 0
-                
-                try:
-                    input_errors = int(interface_errors.get(interface_name, {}).get("inErrors", 0)) if interface_name in interface_errors else 0
-                except (TypeError, KeyError, ValueError):
-                    pass
-                
-                try:
-                    output_errors = int(interface_errors.get(interface_name, {}).get("outErrors", 0)) if interface_name in interface_errors else 0
-                except (TypeError, KeyError, ValueError):
-                    pass
-                
-                if input_errors > 0 or output_errors > 0:
-                    error_interfaces_count += 1
-                
-                # Collect interface information
-                interface_info = {
-                    "name": interface_name,
-                    "description": description,
-                    "status": oper_status,
-                    "bandwidth_mbps": bandwidth_mbps,
-                    "input_rate_mbps": round(input_rate_mbps, 2),
-                    "output_rate_mbps": round(output_rate_mbps, 2),
-                    "input_utilization": round(input_utilization, 2),
-                    "output_utilization": round(output_utilization, 2),
-                    "input_errors": input_errors,
-                    "output_errors": output_errors,
-                    "high_utilization": high_utilization
-                }
-                
-                interfaces.append(interface_info)
-            except Exception as e:
-                if debug:
-                    print(f"DEBUG: Error processing interface {interface_name}: {str(e)}", file=sys.stderr)
-        
-        # Sort interfaces by utilization (highest first)
-        interfaces.sort(key=lambda x: max(x["input_utilization"], x["output_utilization"]), reverse=True)
-        
-        # Create summary
-        summary = {
-            "total_interfaces": len(interfaces),
-            "active_interfaces": active_interfaces_count,
-            "high_utilization_interfaces": high_utilization_count,
-            "error_interfaces": error_interfaces_count
-        }
-        
-        # Get current timestamp
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        
-        # Create the result structure
-        result = {
-            "device": device_info,
-            "timestamp": timestamp,
-            "interfaces": interfaces,
-            "summary": summary
-        }
-        
-        return result
-        
-    except Exception as e:
-        raise RuntimeError(f"Failed to retrieve port utilization data: {str(e)}")
+                print("DEBUG: Error parsing interface descriptions", file=sys.stderr)
+    
+    # Collect all Ethernet interfaces
+    names = [
+        name for name, status in interface_status.items()
+        if name.startswith("Ethernet") and isinstance(status, dict)
+    ]
+    
+    # Extract per-interface values with one lookup per table; missing or malformed
+    # counters count as 0
+    statuses = [interface_status[name] for name in names]
+    rates = [interface_rates.get(name) or _EMPTY for name in names]
+    errors = [interface_errors.get(name) or _EMPTY for name in names]
+    
+    descriptions = [(interface_descriptions.get(name) or _EMPTY).get("description", "") for name in names]
+    oper_statuses = [status.get("linkStatus", "unknown") for status in statuses]
+    bandwidths = [_to_number(status.get("bandwidth", 0), int) / 1000000 for status in statuses]
+    input_rates = [_to_number(rate.get("inRate", 0)) for rate in rates]
+    output_rates = [_to_number(rate.get("outRate", 0)) for rate in rates]
+    input_errors = [_to_number(error.get("inErrors", 0), int) for error in errors]
+    output_errors = [_to_number(error.get("outErrors", 0), int) for error in errors]
+    
+    # Calculate utilization percentages for all interfaces at once; interfaces
+    # without a known bandwidth report 0
+    bandwidth = np.array(bandwidths, dtype=np.float64)
+    has_bandwidth = bandwidth > 0
+    safe_bandwidth = np.where(has_bandwidth, bandwidth, 1.0)
+    input_utilization = np.where(has_bandwidth, np.array(input_rates, dtype=np.float64) / safe_bandwidth * 100, 0.0)
+    output_utilization = np.where(has_bandwidth, np.array(output_rates, dtype=np.float64) / safe_bandwidth * 100, 0.0)
+    
+    # Check which interfaces exceed the threshold or report errors
+    high_utilization = (input_utilization > threshold) | (output_utilization > threshold)
+    has_errors = (np.array(input_errors, dtype=np.int64) > 0) | (np.array(output_errors, dtype=np.int64) > 0)
+    
+    high_utilization_count = int(high_utilization.sum())
+    error_interfaces_count = int(has_errors.sum())
+    active_interfaces_count = oper_statuses.count("up")
+    
+    # Sort interfaces by utilization (highest first); the stable sort keeps ties in device order
+    peak_utilization = np.maximum(np.round(input_utilization, 2), np.round(output_utilization, 2))
+    order = np.argsort(-peak_utilization, kind="stable")
+    
+    # Collect interface information into compact slotted records
+    input_utilization = input_utilization.tolist()
+    output_utilization = output_utilization.tolist()
+    high_utilization = high_utilization.tolist()
+    
+    interfaces = [None] * len(names)
+    for position, i in enumerate(order.tolist()):
+        interfaces[position] = InterfaceUtilization(
+            names[i],
+            descriptions[i],
+            oper_statuses[i],
+            bandwidths[i],
+            round(input_rates[i], 2),
+            round(output_rates[i], 2),
+            round(input_utilization[i], 2),
+            round(output_utilization[i], 2),
+            input_errors[i],
+            output_errors[i],
+            high_utilization[i]
+        )
+    
+    # Create summary
+    summary = {
+        "total_interfaces": len(interfaces),
+        "active_interfaces": active_interfaces_count,
+        "high_utilization_interfaces": high_utilization_count,
+        "error_interfaces": error_interfaces_count
+    }
+    
+    # Get current timestamp unless the caller shares one across a batch
+    if timestamp is None:
+        timestamp = utc_timestamp()
+    
+    # Create the result structure
+    result = {
+        "device": device_info,
+        "timestamp": timestamp,
+        "interfaces": interfaces,
+        "summary": summary
+    }
+    
+    return result
+
+
+def _record_fields(obj):
+    """json.dumps default hook turning slotted records into dicts."""
+    if isinstance(obj, InterfaceUtilization):
+        return {field: getattr(obj, field) for field in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def print_json(data, indent=True):
+    """
+    Write data to stdout as JSON, using orjson when it is installed.
+    
+    orjson writes non-ASCII text such as descriptions as raw UTF-8 where json
+    escapes it (e.g. \\u00e9), so consumers must read the output as UTF-8.
+    
+    Args:
+        data: JSON-serializable result; InterfaceUtilization records become objects
+        indent (bool): Indent with two spaces (default: True)
+    """
+    if orjson is None:
+        print(json.dumps(data, indent=2 if indent else None, default=_record_fields))
+        return
+    
+    # Flush pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def main():
     """Main function that handles script execution and output formatting."""
     parser = argparse.ArgumentParser(description='Arista EOS Switch Port Utilization Analyzer')
-    parser.add_argument('--host', '-H', required=True, help='Arista EOS switch hostname or IP')
+    parser.add_argument('--host', '-H', required=True, nargs='+', help='Arista EOS switch hostname(s) or IP(s)')
     parser.add_argument('--username', '-u', required=True, help='eAPI username')
     parser.add_argument('--password', '-p', required=True, help='eAPI password')
     parser.add_argument('--transport', '-t', default='https', choices=['http', 'https'], help='eAPI transport protocol (default: https)')
     parser.add_argument('--port', '-P', type=int, default=443, help='eAPI port (default: 443)')
     parser.add_argument('--threshold', '-T', type=int, default=70, help='Utilization threshold %% to highlight (default: 70)')
+    parser.add_argument('--concurrency', '-c', type=int, default=50, help='Maximum switches polled at once with multiple hosts (default: 50)')
+    parser.add_argument('--include-descriptions', '--include_descriptions', '-D', action='store_true', help='Include interface descriptions (one extra eAPI command)')
+    parser.add_argument('--refresh-metadata', '--refresh_metadata', '-R', action='store_true', help='Ignore cached device metadata and fetch it again')
     parser.add_argument('--debug', '-d', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
+    # A semaphore of zero would never let a poll start
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
     try:
+        # Forget cached "show version" data so this run refreshes it
+        if args.refresh_metadata:
+            clear_metadata_cache(args.host)
+        
+        # Multiple hosts are polled concurrently and reported as a JSON list
+        if len(args.host) > 1:
+            import asyncio
+            
+            results = asyncio.run(run_many(
+                args.host,
+                args.username,
+                args.password,
+                args.transport,
+                args.port,
+                args.threshold,
+                args.concurrency,
+                args.debug,
+                args.include_descriptions
+            ))
+            print_json(results)
+            
+            # Exit code 1 if any switch could not be polled
+            sys.exit(1 if any(r.get("success") is False for r in results) else 0)
+        
+        args.host = args.host[0]
+        
         if args.debug:
             print(f"DEBUG: Connecting to {args.host} via {args.transport} on port {args.port}...", file=sys.stderr)
             
@@ -327,10 +566,10 @@ def main():
             print("DEBUG: Connection established, retrieving port utilization data...", file=sys.stderr)
             
         # Get port utilization data
-        result = get_port_utilization(node, args.threshold, args.debug)
+        result = get_port_utilization(node, args.threshold, args.debug, args.include_descriptions)
         
         # Always output as JSON for automation consumption
-        print(json.dumps(result, indent=2))
+        print_json(result)
         
         # Exit code 0 for successful operation
         sys.exit(0)
@@ -344,7 +583,7 @@ def main():
             "error": str(e),
             "success": False
         }
-        print(json.dumps(error_json))
+        print_json(error_json, indent=False)
         
         # Exit with code 1 on exceptions
         sys.exit(1)
@@ -13,15 +13,27 @@ Automation use cases:
 Output format:
 - JSON: Structured output for automation systems and dashboards
 
+Device metadata:
+- Hostname and platform are cached per device in ~/.cache/net-tools/ios-device-meta.sqlite
+  for an hour, so later runs skip "show version" and the hostname lookup.
+
+Optional dependencies:
+- ssh2-python: Lower-latency SSH sessions for single-host runs (falls back to paramiko)
+- google-re2: Faster BGP neighbor parsing on routers with many sessions (falls back to re)
+- orjson: Faster JSON output for large results (falls back to json; non-ASCII text is
+  written as raw UTF-8 rather than \\u escapes)
+
 Parameters:
-  --host HOST - Target Cisco IOS-XE device hostname or IP
+  --host HOST [HOST ...] - Target Cisco IOS-XE device hostname(s) or IP(s)
   --username USERNAME - SSH username
   --password PASSWORD - SSH password
   --neighbor NEIGHBOR_IP - [Optional] Specific BGP neighbor to check
+  --restconf - [Optional] Query BGP state over RESTCONF, falling back to SSH on failure
+  --concurrency N - [Optional] Maximum devices polled at once with multiple hosts (default: 50)
 
 Exit codes:
   0 - Success (successfully retrieved BGP neighbor status)
-  1 - Error occurred
+  1 - Error occurred (with multiple hosts: at least one device failed)
 
 Usage examples:
   Check all BGP neighbors:
@@ -29,18 +41,612 @@ Usage examples:
 
   Check specific BGP neighbor:
     python cisco-ios-xe-bgp-status.py --host 10.1.1.1 --username admin --password cisco --neighbor 10.2.2.2
+
+  Use RESTCONF structured data (SSH is used if RESTCONF is unavailable):
+    python cisco-ios-xe-bgp-status.py --host 10.1.1.1 --username admin --password cisco --restconf
+
+  Check several devices concurrently (outputs a JSON list, one entry per host):
+    python cisco-ios-xe-bgp-status.py --host 10.1.1.1 10.1.1.2 --username admin --password cisco
 """
 
 import sys
 import json
 import argparse
+import atexit
+import codecs
+import os
+import threading
+import time
 import paramiko
 import re
+import socket
+import sqlite3
+
+# asyncio, asyncssh and concurrent.futures (multiple hosts) and requests/urllib3
+# (--restconf) are imported by the functions that use them, so a single-host SSH run
+# does not pay for loading them
+
+try:
+    # google-re2 is a linear-time, drop-in engine for the neighbor parse on large outputs
+    import re2 as _neighbor_re
+except ImportError:
+    _neighbor_re = re
+
+try:
+    # ssh2-python binds libssh2, so SSH framing and crypto run in native code
+    from ssh2.session import Session as Ssh2Session
+    from ssh2.exceptions import AuthenticationError as Ssh2AuthenticationError, SSH2Error
+except ImportError:
+    Ssh2Session = None
+
+try:
+    # orjson serializes large results several times faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# Regular expressions for "show ip bgp summary" and "show ip bgp neighbors" output,
+# compiled once at import
+_RE_LOCAL_AS = re.compile(r"local AS number (\d+)")
+_RE_ROUTER_ID = re.compile(r"BGP router identifier (\d+\.\d+\.\d+\.\d+)")
+
+# An exec prompt such as "R1#" or "edge-01.lab>", matched against the last line read
+_RE_PROMPT = re.compile(rb"[\w.:/-]+[#>]")
+# A "BGP neighbor is" header starts each neighbor section; the field patterns are
+# searched within one section at a time
+_RE_SECTION_HEADER = _neighbor_re.compile(r"BGP neighbor is")
+_RE_NEIGHBOR = _neighbor_re.compile(r"BGP neighbor is (\d+\.\d+\.\d+\.\d+),\s+remote AS (\d+)")
+_RE_STATE = _neighbor_re.compile(r"BGP state = (\w+)")
+_RE_UPTIME = _neighbor_re.compile(r"Up for (\d+:\d+:\d+|\d+\w+\d+\w+)")
+_RE_PREFIXES_RECEIVED = _neighbor_re.compile(r"(\d+) accepted prefixes")
+_RE_PREFIXES_SENT = _neighbor_re.compile(r"(\d+) announced prefixes")
+_RE_DESCRIPTION = _neighbor_re.compile(r"Description: (.*)")
+
+# "show ip bgp neighbors" outputs larger than this many characters are parsed in a
+# worker process during multi-host runs
+PARSE_OFFLOAD_THRESHOLD = 100 * 1024
+
+# On-disk cache of device (hostname, platform), shared by successive runs
+DEVICE_META_PATH = os.path.expanduser("~/.cache/net-tools/ios-device-meta.sqlite")
+
+# Seconds before cached hostname and platform are queried again
+DEVICE_META_TTL = 3600
+
+_META_DB = None
+
+# Open SSH clients keyed by (host, username), reused across get_bgp_neighbors calls
+_SSH_POOL = {}
+_SSH_POOL_LOCK = threading.Lock()
+
+# Seconds between SSH keepalive packets on pooled connections
+SSH_KEEPALIVE_INTERVAL = 30
+
+
+class _Ssh2Channel:
+    """Expose an ssh2-python shell channel through the paramiko.Channel calls used here."""
+    
+    def __init__(self, channel):
+        self._channel = channel
+    
+    def recv(self, size):
+        # Blocking read; b"" at end of stream, timeouts raise ssh2.exceptions.Timeout
+        return self._channel.read(size)[1]
+    
+    def send(self, data):
+        self._channel.write(data)
+    
+    def close(self):
+        self._channel.close()
+
+
+def _connect(host, username, password, timeout=10):
+    """
+    Open an SSH session to the device, using libssh2 when ssh2-python is installed.
+    
+    Connection and authentication failures are raised as the matching paramiko
+    exceptions so callers handle both backends the same way.
+    
+    Args:
+        host (str): The hostname or IP address of the Cisco IOS-XE device
+        username (str): SSH username for the device
+        password (str): SSH password for the device
+        timeout (int): Seconds to wait for the TCP connection (default: 10)
+        
+    Returns:
+        ssh2.session.Session or paramiko.SSHClient: Connected, authenticated session
+    """
+    if Ssh2Session is None:
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh_client.connect(
+            hostname=host, 
+            username=username, 
+            password=password, 
+            timeout=timeout,
+            look_for_keys=False,
+            allow_agent=False
+        )
+        ssh_client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        return ssh_client
+    
+    try:
+        sock = socket.create_connection((host, 22), timeout=timeout)
+    except OSError as e:
+        raise paramiko.ssh_exception.NoValidConnectionsError({(host, 22): e})
+    
+    # libssh2 drives the socket itself and applies its own timeout to blocking calls
+    sock.settimeout(None)
+    session = Ssh2Session()
+    session.set_timeout(timeout * 1000)
+    try:
+        session.handshake(sock)
+        session.userauth_password(username, password)
+    except Ssh2AuthenticationError as e:
+        sock.close()
+        raise paramiko.ssh_exception.AuthenticationException(str(e) or "password rejected")
+    except Exception:
+        sock.close()
+        raise
+    
+    # libssh2 has no keepalive thread; keepalives go out when the pool probes the session
+    session.keepalive_config(False, SSH_KEEPALIVE_INTERVAL)
+    return session
+
+
+def _client_alive(ssh_client):
+    """Probe a pooled session so a silently dropped connection is rebuilt."""
+    try:
+        if isinstance(ssh_client, paramiko.SSHClient):
+            transport = ssh_client.get_transport()
+            if transport is None or not transport.is_active():
+                return False
+            transport.send_ignore()
+        else:
+            ssh_client.keepalive_send()
+        return True
+    except (EOFError, OSError, paramiko.ssh_exception.SSHException):
+        return False
+    except Exception as e:
+        if Ssh2Session is not None and isinstance(e, SSH2Error):
+            return False
+        raise
+
+
+def _close_client(ssh_client):
+    """Close a paramiko client or ssh2-python session and its socket."""
+    if isinstance(ssh_client, paramiko.SSHClient):
+        ssh_client.close()
+        return
+    try:
+        ssh_client.disconnect()
+    except Exception:
+        pass
+    ssh_client.sock.close()
+
+
+def _open_shell(ssh_client, timeout):
+    """
+    Open an interactive shell channel with a wide terminal.
+    
+    Args:
+        ssh_client (ssh2.session.Session or paramiko.SSHClient): Connected session
+        timeout (int): Seconds to wait for any single read
+        
+    Returns:
+        paramiko.Channel or _Ssh2Channel: Channel providing recv, send and close
+    """
+    if isinstance(ssh_client, paramiko.SSHClient):
+        channel = ssh_client.invoke_shell(width=511)
+        channel.settimeout(timeout)
+        return channel
+    
+    ssh_client.set_timeout(timeout * 1000)
+    channel = ssh_client.open_session()
+    channel.pty()
+    channel.shell()
+    return _Ssh2Channel(channel)
+
+
+def _get_client(host, username, password):
+    """
+    Return a connected SSH client for the device, reusing a pooled one when its session is alive.
+    
+    Args:
+        host (str): The hostname or IP address of the Cisco IOS-XE device
+        username (str): SSH username for the device
+        password (str): SSH password for the device
+        
+    Returns:
+        ssh2.session.Session or paramiko.SSHClient: Connected session, owned by the pool
+    """
+    key = (host, username)
+    with _SSH_POOL_LOCK:
+        ssh_client = _SSH_POOL.pop(key, None)
+        if ssh_client is not None:
+            if _client_alive(ssh_client):
+                _SSH_POOL[key] = ssh_client
+                return ssh_client
+            _close_client(ssh_client)
+        
+        ssh_client = _connect(host, username, password)
+        _SSH_POOL[key] = ssh_client
+        return ssh_client
+
+
+def _discard_client(host, username):
+    """Drop and close the pooled SSH client for the device, if any."""
+    with _SSH_POOL_LOCK:
+        ssh_client = _SSH_POOL.pop((host, username), None)
+    if ssh_client is not None:
+        _close_client(ssh_client)
+
+
+@atexit.register
+def _close_pooled_clients():
+    """Close every pooled SSH client at interpreter exit."""
+    with _SSH_POOL_LOCK:
+        for ssh_client in _SSH_POOL.values():
+            _close_client(ssh_client)
+        _SSH_POOL.clear()
+
+
+def parse_bgp_neighbors(neighbors_output):
+    """
+    Parse "show ip bgp neighbors" output into a list of neighbor entries.
+    
+    Args:
+        neighbors_output (str): Raw "show ip bgp neighbors" output
+        
+    Returns:
+        list: One dict per BGP neighbor (see get_bgp_neighbors for the schema)
+    """
+    # Parse BGP neighbors details
+    neighbors = []
+    
+    # Each section runs from its header to the next one. Sections are sliced one at a
+    # time rather than searched in place: google-re2 re-encodes the whole subject
+    # string on every call, which pos/endpos bounds do not avoid.
+    starts = [match.start() for match in _RE_SECTION_HEADER.finditer(neighbors_output)]
+    ends = starts[1:] + [len(neighbors_output)]
+    
+    for start, end in zip(starts, ends):
+        section = neighbors_output[start:end]
+        
+        # Sections for non-IPv4 neighbors do not match and are skipped
+        neighbor_match = _RE_NEIGHBOR.match(section)
+        if not neighbor_match:
+            continue
+        
+        state_match = _RE_STATE.search(section)
+        uptime_match = _RE_UPTIME.search(section)
+        prefixes_received_match = _RE_PREFIXES_RECEIVED.search(section)
+        prefixes_sent_match = _RE_PREFIXES_SENT.search(section)
+        description_match = _RE_DESCRIPTION.search(section)
+        
+        neighbor_info = {
+            "neighbor_ip": neighbor_match.group(1),
+            "remote_as": neighbor_match.group(2),
+            "state": state_match.group(1) if state_match else "Unknown",
+            "uptime": uptime_match.group(1) if uptime_match else "N/A",
+            "prefixes_received": int(prefixes_received_match.group(1)) if prefixes_received_match else 0,
+            "prefixes_sent": int(prefixes_sent_match.group(1)) if prefixes_sent_match else 0,
+            "description": description_match.group(1) if description_match else ""
+        }
+        
+        neighbors.append(neighbor_info)
+    
+    return neighbors
+
+
+def parse_bgp_summary(summary_output):
+    """
+    Extract the local AS number and router ID from "show ip bgp summary" output.
+    
+    Args:
+        summary_output (str): Raw "show ip bgp summary" output
+        
+    Returns:
+        tuple: (local_as, router_id), each "Unknown" when not found
+    """
+    local_as_match = _RE_LOCAL_AS.search(summary_output)
+    local_as = local_as_match.group(1) if local_as_match else "Unknown"
+    
+    router_id_match = _RE_ROUTER_ID.search(summary_output)
+    router_id = router_id_match.group(1) if router_id_match else "Unknown"
+    
+    return local_as, router_id
+
+
+def parse_bgp_neighbors_stream(chunks):
+    """
+    Parse "show ip bgp neighbors" output incrementally from text chunks.
+    
+    Every section before the last "BGP neighbor is" header seen so far is
+    complete, so it is parsed and released; only the current section is kept.
+    
+    Args:
+        chunks (iterable): Output text in arbitrary chunks
+        
+    Returns:
+        list: One dict per BGP neighbor, as returned by parse_bgp_neighbors
+    """
+    neighbors = []
+    pending = ""
+    
+    for chunk in chunks:
+        pending += chunk
+        cut = pending.rfind("BGP neighbor is")
+        if cut > 0:
+            neighbors.extend(parse_bgp_neighbors(pending[:cut]))
+            pending = pending[cut:]
+    
+    neighbors.extend(parse_bgp_neighbors(pending))
+    return neighbors
+
+
+def build_bgp_result(hostname, platform, local_as, router_id, neighbors):
+    """
+    Build the BGP status result from the device details and parsed neighbors.
+    
+    Args:
+        hostname (str): Device hostname
+        platform (str): Device platform string
+        local_as (str): Local BGP AS number
+        router_id (str): BGP router identifier
+        neighbors (list): Neighbor entries, one dict per BGP neighbor
+        
+    Returns:
+        dict: Structured BGP neighbor data (see get_bgp_neighbors for the schema)
+    """
+    # Calculate BGP session summary
+    total_neighbors = len(neighbors)
+    established_sessions = sum(1 for n in neighbors if n["state"] == "Established")
+    down_sessions = total_neighbors - established_sessions
+    
+    # Create the full result structure
+    result = {
+        "device": {
+            "hostname": hostname,
+            "platform": platform
+        },
+        "bgp": {
+            "local_as": local_as,
+            "router_id": router_id
+        },
+        "neighbors": neighbors,
+        "summary": {
+            "total_neighbors": total_neighbors,
+            "established_sessions": established_sessions,
+            "down_sessions": down_sessions
+        }
+    }
+    
+    return result
+
+
+def _metadata_db():
+    """Open the device metadata cache, creating it on first use."""
+    global _META_DB
+    if _META_DB is None:
+        os.makedirs(os.path.dirname(DEVICE_META_PATH), exist_ok=True)
+        db = sqlite3.connect(DEVICE_META_PATH)
+        db.execute("CREATE TABLE IF NOT EXISTS device_meta (host TEXT PRIMARY KEY, updated REAL, hostname TEXT, platform TEXT)")
+        _META_DB = db
+    return _META_DB
+
+
+def _get_cached_device_meta(host):
+    """Return the cached (hostname, platform) for the device, or None when missing, expired or unreadable."""
+    try:
+        row = _metadata_db().execute(
+            "SELECT updated, hostname, platform FROM device_meta WHERE host = ?", (host,)
+        ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None or time.time() - row[0] >= DEVICE_META_TTL:
+        return None
+    return row[1], row[2]
+
+
+def _parse_hostname(output):
+    """
+    Extract the hostname from "show hostname" or "show running-config | include hostname" output.
+    
+    Args:
+        output (str): Raw command output
+        
+    Returns:
+        str: The hostname, or None when the command failed or printed nothing
+    """
+    output = output.strip()
+    if output.startswith("hostname "):
+        output = output[len("hostname "):]
+    
+    # Hostnames have no whitespace; this also rejects errors printed without a "%",
+    # such as 'Line has invalid autocommand "show hostname"' on exec channels
+    if not output or "%" in output or len(output.split()) != 1:
+        return None
+    return output
+
+
+def _cache_device_meta(host, version_output, hostname=None):
+    """
+    Determine the device platform and cache it with the hostname for DEVICE_META_TTL seconds.
+    
+    Args:
+        host (str): The hostname or IP address of the device, used as the cache key
+        version_output (str): Raw "show version | include Software" output
+        hostname (str, optional): Device hostname; host is used when not known
+        
+    Returns:
+        tuple: (hostname, platform)
+    """
+    platform = "Cisco IOS-XE" if "IOS-XE" in version_output else "Cisco IOS"
+    hostname = hostname or host
+    
+    # Cache write failures only cost the next run the lookup
+    try:
+        with _metadata_db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO device_meta (host, updated, hostname, platform) VALUES (?, ?, ?, ?)",
+                (host, time.time(), hostname, platform)
+            )
+    except (OSError, sqlite3.Error):
+        pass
+    return hostname, platform
+
+
+def _read_until_prompt(channel, prompt=None):
+    """
+    Read from an interactive channel until the device prompt ends the buffer.
+    
+    Args:
+        channel (paramiko.Channel or _Ssh2Channel): Interactive shell channel
+        prompt (bytes, optional): Exact prompt to wait for; any last line that
+                                  looks like an exec prompt is accepted when omitted
+        
+    Returns:
+        bytes: Everything read, including the trailing prompt
+    """
+    buffer = b""
+    while True:
+        chunk = channel.recv(65535)
+        if not chunk:
+            raise EOFError("SSH channel closed before the device prompt was received")
+        buffer += chunk
+        
+        tail = buffer.rstrip()
+        if prompt is not None:
+            if tail.endswith(prompt):
+                return buffer
+        elif _RE_PROMPT.fullmatch(tail.rsplit(b"\n", 1)[-1].strip()):
+            return buffer
+
+
+def _iter_until_prompt(channel, prompt):
+    """
+    Yield raw chunks from an interactive channel until the device prompt ends the stream.
+    
+    Only a short tail is held back between reads, to recognise a prompt split
+    across two reads, so the full output is never buffered.
+    
+    Args:
+        channel (paramiko.Channel or _Ssh2Channel): Interactive shell channel
+        prompt (bytes): Exact prompt that ends the output
+    
+    Yields:
+        bytes: Output chunks, excluding the trailing prompt
+    """
+    holdback = len(prompt) + 16
+    tail = b""
+    while True:
+        chunk = channel.recv(65535)
+        if not chunk:
+            raise EOFError("SSH channel closed before the device prompt was received")
+        data = tail + chunk
+        
+        stripped = data.rstrip()
+        if stripped.endswith(prompt):
+            yield stripped[:-len(prompt)]
+            return
+        
+        yield data[:-holdback]
+        tail = data[-holdback:]
+
+
+def _command_output(channel, command, prompt):
+    """
+    Send a command and yield its decoded output as it arrives.
+    
+    Line endings are normalized to "\n" and the echoed command line is dropped.
+    
+    Args:
+        channel (paramiko.Channel or _Ssh2Channel): Interactive shell channel
+        command (str): Command to run
+        prompt (bytes): Exact prompt that ends the output
+    
+    Yields:
+        str: Output text chunks
+    """
+    channel.send(command + "\n")
+    
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    echo_pending = True
+    carry = ""
+    for chunk in _iter_until_prompt(channel, prompt):
+        text = carry + decoder.decode(chunk)
+        
+        # Hold back a trailing "\r" in case its "\n" arrives with the next chunk
+        carry = "\r" if text.endswith("\r") else ""
+        text = text[:len(text) - len(carry)].replace("\r\n", "\n")
+        
+        if echo_pending:
+            echo, newline, text = text.partition("\n")
+            if not newline:
+                continue
+            echo_pending = False
+        yield text
+    
+    if not echo_pending:
+        yield carry + decoder.decode(b"", final=True)
+
+
+def _run_commands(ssh_client, commands, timeout=60, parse_last=None):
+    """
+    Run several show commands over a single interactive shell channel.
+    
+    The device prompt delimits the output of each command, so the channel is
+    opened once instead of once per command.
+    
+    Args:
+        ssh_client (ssh2.session.Session or paramiko.SSHClient): Connected SSH session
+        commands (list): Commands to run, in order
+        timeout (int): Seconds to wait for any single read (default: 60)
+        parse_last (callable, optional): Consumes the last command's output as an
+            iterable of text chunks while it streams in; its return value replaces
+            that output
+    
+    Returns:
+        tuple: (prompt, outputs) where prompt is the device prompt (e.g. "R1#") and
+               outputs is the decoded output of each command, in order
+    """
+    channel = _open_shell(ssh_client, timeout)
+    try:
+        # Wait out the login banner, then take the prompt from the reply to a bare
+        # newline, so a banner line ending in "#" or ">" is never mistaken for it
+        _read_until_prompt(channel)
+        channel.send("\n")
+        prompt = _read_until_prompt(channel).rstrip().splitlines()[-1].strip()
+        
+        # Disable paging; the libssh2 pty request takes no width, so widen it here
+        setup_commands = ["terminal length 0"]
+        if isinstance(channel, _Ssh2Channel):
+            setup_commands.append("terminal width 511")
+        for command in setup_commands:
+            channel.send(command + "\n")
+            _read_until_prompt(channel, prompt)
+        
+        outputs = []
+        for index, command in enumerate(commands):
+            chunks = _command_output(channel, command, prompt)
+            if parse_last is not None and index == len(commands) - 1:
+                outputs.append(parse_last(chunks))
+            else:
+                outputs.append("".join(chunks))
+        
+        return prompt.decode(errors="replace"), outputs
+    finally:
+        channel.close()
+
 
 def get_bgp_neighbors(host, username, password, specific_neighbor=None):
     """
     Connect to a Cisco IOS-XE device and retrieve BGP neighbor status.
     
+    The SSH session is kept open in a module-level pool and reused by later
+    calls for the same host and username; pooled sessions close at exit. The
+    device hostname and platform are cached on disk for DEVICE_META_TTL seconds.
+    
     Args:
         host (str): The hostname or IP address of the Cisco IOS-XE device
         username (str): SSH username for the device
@@ -78,132 +684,47 @@ def get_bgp_neighbors(host, username, password, specific_neighbor=None):
               }
     """
     try:
-        # Connect to the device
-        ssh_client = paramiko.SSHClient()
-        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh_client.connect(
-            hostname=host, 
-            username=username, 
-            password=password, 
-            timeout=10,
-            look_for_keys=False,
-            allow_agent=False
-        )
+        # Connect to the device, reusing a pooled session when available
+        ssh_client = _get_client(host, username, password)
         
-        # Get device hostname and platform
-        stdin, stdout, stderr = ssh_client.exec_command("show version | include Software")
-        version_output = stdout.read().decode()
-        platform = "Cisco IOS-XE" if "IOS-XE" in version_output else "Cisco IOS"
-        
-        stdin, stdout, stderr = ssh_client.exec_command("show running-config | include hostname")
-        hostname_output = stdout.read().decode().strip()
-        hostname = hostname_output.replace("hostname ", "") if "hostname" in hostname_output else host
-        
-        # Get BGP router information
-        stdin, stdout, stderr = ssh_client.exec_command("show ip bgp summary")
-        summary_output = stdout.read().decode()
-        
-        # Extract BGP local AS and router ID
-        local_as_match = re.search(r"local AS number (\d+)", summary_output)
-        local_as = local_as_match.group(1) if local_as_match else "Unknown"
-        
-        router_id_match = re.search(r"BGP router identifier (\d+\.\d+\.\d+\.\d+)", summary_output)
-        router_id = router_id_match.group(1) if router_id_match else "Unknown"
-        
-        # Get BGP neighbors information
+        # Run every command over one interactive shell channel
         if specific_neighbor:
-            stdin, stdout, stderr = ssh_client.exec_command(f"show ip bgp neighbors {specific_neighbor}")
+            neighbors_command = f"show ip bgp neighbors {specific_neighbor}"
         else:
-            stdin, stdout, stderr = ssh_client.exec_command("show ip bgp neighbors")
+            neighbors_command = "show ip bgp neighbors"
         
-        neighbors_output = stdout.read().decode()
+        commands = ["show ip bgp summary", neighbors_command]
         
-        # Parse BGP neighbors details
-        neighbors = []
+        # Device hostname and platform are only queried when not cached
+        device_meta = _get_cached_device_meta(host)
+        if device_meta is None:
+            commands = ["show version | include Software"] + commands
         
-        # Regular expressions to extract BGP neighbor details
-        neighbor_regex = r"BGP neighbor is (\d+\.\d+\.\d+\.\d+),\s+remote AS (\d+)"
-        state_regex = r"BGP state = (\w+)"
-        uptime_regex = r"Up for (\d+:\d+:\d+|\d+\w+\d+\w+)"
-        prefixes_received_regex = r"(\d+) accepted prefixes"
-        prefixes_sent_regex = r"(\d+) announced prefixes"
-        description_regex = r"Description: (.*)"
-        
-        # Split output by BGP neighbor sections
-        neighbor_sections = re.split(r"BGP neighbor is", neighbors_output)[1:]
-        
-        # If no neighbor sections found but command succeeded, return empty neighbors list
-        if not neighbor_sections and "% No such neighbor" not in neighbors_output:
-            # We have a successful connection but no neighbors configured
-            pass
-        
-        for section in neighbor_sections:
-            section = "BGP neighbor is" + section
-            neighbor_match = re.search(neighbor_regex, section)
-            
-            if neighbor_match:
-                neighbor_ip = neighbor_match.group(1)
-                remote_as = neighbor_match.group(2)
-                
-                state_match = re.search(state_regex, section)
-                state = state_match.group(1) if state_match else "Unknown"
-                
-                uptime_match = re.search(uptime_regex, section)
-                uptime = uptime_match.group(1) if uptime_match else "N/A"
-                
-                prefixes_received_match = re.search(prefixes_received_regex, section)
-                prefixes_received = int(prefixes_received_match.group(1)) if prefixes_received_match else 0
-                
-                prefixes_sent_match = re.search(prefixes_sent_regex, section)
-                prefixes_sent = int(prefixes_sent_match.group(1)) if prefixes_sent_match else 0
-                
-                description_match = re.search(description_regex, section)
-                description = description_match.group(1) if description_match else ""
-                
-                neighbor_info = {
-                    "neighbor_ip": neighbor_ip,
-                    "remote_as": remote_as,
-                    "state": state,
-                    "uptime": uptime,
-                    "prefixes_received": prefixes_received,
-                    "prefixes_sent": prefixes_sent,
-                    "description": description
-                }
-                
-                neighbors.append(neighbor_info)
+        # The neighbors output is parsed while it streams in rather than buffered whole
+        prompt, outputs = _run_commands(ssh_client, commands, parse_last=parse_bgp_neighbors_stream)
         
-        # Calculate BGP session summary
-        total_neighbors = len(neighbors)
-        established_sessions = sum(1 for n in neighbors if n["state"] == "Established")
-        down_sessions = total_neighbors - established_sessions
+        # Get device hostname and platform; the exec prompt ("R1#" or "R1>") carries
+        # the hostname, so the running config is never rendered for it
+        if device_meta is None:
+            device_meta = _cache_device_meta(host, outputs[0], prompt.rstrip("#>"))
+            outputs = outputs[1:]
+        hostname, platform = device_meta
         
-        ssh_client.close()
+        summary_output, neighbors = outputs
         
-        # Create the full result structure
-        result = {
-            "device": {
-                "hostname": hostname,
-                "platform": platform
-            },
-            "bgp": {
-                "local_as": local_as,
-                "router_id": router_id
-            },
-            "neighbors": neighbors,
-            "summary": {
-                "total_neighbors": total_neighbors,
-                "established_sessions": established_sessions,
-                "down_sessions": down_sessions
-            }
-        }
+        # Build the result structure
+        local_as, router_id = parse_bgp_summary(summary_output)
         
-        return result
+        return build_bgp_result(hostname, platform, local_as, router_id, neighbors)
         
     except paramiko.ssh_exception.NoValidConnectionsError as e:
         raise RuntimeError(f"Failed to connect to device: {str(e)}")
     except paramiko.ssh_exception.AuthenticationException as e:
         raise RuntimeError(f"Authentication failed: {str(e)}")
     except Exception as e:
+        # The session may be broken; rebuild it on the next call
+        _discard_client(host, username)
+        
         # If the error is about no BGP session, return an empty neighbors list instead of error
         if "No existing session" in str(e) or "BGP not active" in str(e) or "%BGP" in str(e):
             return {
@@ -227,21 +748,291 @@ def get_bgp_neighbors(host, username, password, specific_neighbor=None):
             raise RuntimeError(f"Failed to retrieve BGP neighbor information: {str(e)}")
 
 
+# Cisco-IOS-XE-bgp-oper session-state values mapped to the CLI "BGP state" names
+RESTCONF_SESSION_STATES = {
+    "fsm-idle": "Idle",
+    "fsm-connect": "Connect",
+    "fsm-active": "Active",
+    "fsm-opensent": "OpenSent",
+    "fsm-openconfirm": "OpenConfirm",
+    "fsm-established": "Established"
+}
+
+
+def get_bgp_neighbors_restconf(host, username, password, specific_neighbor=None, timeout=10):
+    """
+    Retrieve BGP neighbor status from the IOS-XE RESTCONF API instead of the CLI.
+    
+    Reads structured state from the Cisco-IOS-XE-bgp-oper model, so no show
+    command output has to be parsed.
+    
+    Args:
+        host (str): The hostname or IP address of the Cisco IOS-XE device
+        username (str): RESTCONF username for the device
+        password (str): RESTCONF password for the device
+        specific_neighbor (str, optional): Filter results to a specific BGP neighbor
+        timeout (int): HTTP timeout in seconds (default: 10)
+        
+    Returns:
+        dict: Structured BGP neighbor data (see get_bgp_neighbors for the schema)
+    """
+    import requests
+    import urllib3
+    
+    # RESTCONF requests skip certificate verification for self-signed device certificates
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    
+    base_url = f"https://{host}/restconf/data"
+    
+    try:
+        with requests.Session() as session:
+            session.auth = (username, password)
+            session.verify = False
+            session.headers.update({"Accept": "application/yang-data+json"})
+            
+            def get_data(path):
+                response = session.get(f"{base_url}/{path}", timeout=timeout)
+                # RESTCONF answers 204 when the requested container is empty
+                if response.status_code == 204:
+                    return {}
+                response.raise_for_status()
+                return response.json()
+            
+            hostname = get_data("Cisco-IOS-XE-native:native/hostname").get("Cisco-IOS-XE-native:hostname", host)
+            address_families = get_data("Cisco-IOS-XE-bgp-oper:bgp-state-data/address-families")
+            bgp_neighbors = get_data("Cisco-IOS-XE-bgp-oper:bgp-state-data/neighbors")
+        
+        # Local AS and router ID come from the first address family that reports them
+        local_as = "Unknown"
+        router_id = "Unknown"
+        for address_family in address_families.get("Cisco-IOS-XE-bgp-oper:address-families", {}).get("address-family", []):
+            if "local-as" in address_family:
+                local_as = str(address_family["local-as"])
+                router_id = address_family.get("router-id", "Unknown")
+                break
+        
+        # A neighbor is listed once per address family; keep its first entry
+        neighbors = []
+        seen = set()
+        for entry in bgp_neighbors.get("Cisco-IOS-XE-bgp-oper:neighbors", {}).get("neighbor", []):
+            neighbor_ip = entry.get("neighbor-id")
+            if neighbor_ip in seen or (specific_neighbor and neighbor_ip != specific_neighbor):
+                continue
+            seen.add(neighbor_ip)
+            
+            session_state = entry.get("session-state", "")
+            prefix_activity = entry.get("prefix-activity", {})
+            
+            neighbors.append({
+                "neighbor_ip": neighbor_ip,
+                "remote_as": str(entry.get("as", "Unknown")),
+                "state": RESTCONF_SESSION_STATES.get(session_state, session_state or "Unknown"),
+                "uptime": entry.get("up-time") or "N/A",
+                "prefixes_received": int(entry.get("installed-prefixes", 0)),
+                "prefixes_sent": int(prefix_activity.get("sent", {}).get("current-prefixes", 0)),
+                "description": entry.get("description", "")
+            })
+        
+        return build_bgp_result(hostname, "Cisco IOS-XE", local_as, router_id, neighbors)
+        
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve BGP neighbor information via RESTCONF: {str(e)}")
+
+
+async def get_bgp_neighbors_async(host, username, password, specific_neighbor=None, parse_pool=None):
+    """
+    Retrieve BGP neighbor status over a single asyncssh connection.
+    
+    Runs the same commands as get_bgp_neighbors without blocking the event loop,
+    so many devices can be polled concurrently with run_many.
+    
+    Args:
+        host (str): The hostname or IP address of the Cisco IOS-XE device
+        username (str): SSH username for the device
+        password (str): SSH password for the device
+        specific_neighbor (str, optional): Filter results to a specific BGP neighbor
+        parse_pool (concurrent.futures.ProcessPoolExecutor, optional): Pool that parses
+            outputs larger than PARSE_OFFLOAD_THRESHOLD off the event loop
+        
+    Returns:
+        dict: Structured BGP neighbor data (see get_bgp_neighbors for the schema)
+    """
+    import asyncio
+    import asyncssh
+    
+    try:
+        async with asyncssh.connect(
+            host,
+            username=username,
+            password=password,
+            known_hosts=None,
+            connect_timeout=10
+        ) as conn:
+            # Get device hostname and platform, unless cached
+            device_meta = _get_cached_device_meta(host)
+            if device_meta is None:
+                version_output = await _exec_output(conn, "show version | include Software")
+                
+                # Exec channels have no prompt; filter the running config only when
+                # "show hostname" is not supported
+                hostname = _parse_hostname(await _exec_output(conn, "show hostname"))
+                if hostname is None:
+                    hostname = _parse_hostname(await _exec_output(conn, "show running-config | include hostname"))
+                
+                device_meta = _cache_device_meta(host, version_output, hostname)
+            hostname, platform = device_meta
+            
+            # Get BGP router and neighbors information
+            summary_output = await _exec_output(conn, "show ip bgp summary")
+            
+            if specific_neighbor:
+                neighbors_output = await _exec_output(conn, f"show ip bgp neighbors {specific_neighbor}")
+            else:
+                neighbors_output = await _exec_output(conn, "show ip bgp neighbors")
+        
+        # Large outputs are parsed in a worker process so the regex work does not
+        # stall the other polls; small ones are cheaper to parse than to pickle
+        if parse_pool is not None and len(neighbors_output) > PARSE_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            neighbors = await loop.run_in_executor(parse_pool, parse_bgp_neighbors, neighbors_output)
+        else:
+            neighbors = parse_bgp_neighbors(neighbors_output)
+        
+        local_as, router_id = parse_bgp_summary(summary_output)
+        
+        return build_bgp_result(hostname, platform, local_as, router_id, neighbors)
+        
+    except asyncssh.PermissionDenied as e:
+        raise RuntimeError(f"Authentication failed: {str(e)}")
+    except OSError as e:
+        raise RuntimeError(f"Failed to connect to device: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve BGP neighbor information: {str(e)}")
+
+
+async def _exec_output(conn, command):
+    """
+    Run a command on an exec channel and return its output with "\n" line endings.
+    
+    IOS ends exec channel lines with "\r\n"; the shell path normalizes them in
+    _command_output, so both paths hand the parsers the same text.
+    
+    Args:
+        conn (asyncssh.SSHClientConnection): Open connection to the device
+        command (str): Command to run
+        
+    Returns:
+        str: Command output
+    """
+    return (await conn.run(command)).stdout.replace("\r\n", "\n")
+
+
+async def run_many(hosts, username, password, specific_neighbor=None, concurrency=50):
+    """
+    Poll many devices concurrently, at most `concurrency` at a time.
+    
+    Args:
+        hosts (list): Cisco IOS-XE device hostnames or IPs
+        username (str): SSH username for the devices
+        password (str): SSH password for the devices
+        specific_neighbor (str, optional): Filter results to a specific BGP neighbor
+        concurrency (int): Maximum number of devices polled at once (default: 50)
+        
+    Returns:
+        list: One result per host, in input order. Failed hosts are reported as
+              {"host": ..., "error": ..., "success": False}.
+    """
+    import asyncio
+    import concurrent.futures
+    import multiprocessing
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    # Forking this process is unsafe once the event loop's resolver threads are running,
+    # so parse workers start from a clean forkserver (or spawn where it is unavailable)
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(start_method)
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as parse_pool:
+        async def poll(host):
+            async with semaphore:
+                try:
+                    return await get_bgp_neighbors_async(host, username, password, specific_neighbor, parse_pool)
+                except Exception as e:
+                    return {"host": host, "error": str(e), "success": False}
+        
+        return await asyncio.gather(*(poll(host) for host in hosts))
+
+
+def print_json(data, indent=True):
+    """
+    Write data to stdout as JSON, using orjson when it is installed.
+    
+    orjson writes non-ASCII text such as descriptions as raw UTF-8 where json
+    escapes it (e.g. \\u00e9), so consumers must read the output as UTF-8.
+    
+    Args:
+        data: JSON-serializable result
+        indent (bool): Indent with two spaces (default: True)
+    """
+    if orjson is None:
+        print(json.dumps(data, indent=2 if indent else None))
+        return
+    
+    # Flush pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def main():
     """Main function that handles script execution and output formatting."""
     parser = argparse.ArgumentParser(description='Cisco IOS-XE BGP Neighbor Status Checker')
-    parser.add_argument('--host', '-H', required=True, help='Cisco IOS-XE device hostname or IP')
+    parser.add_argument('--host', '-H', required=True, nargs='+', help='Cisco IOS-XE device hostname(s) or IP(s)')
     parser.add_argument('--username', '-u', required=True, help='SSH username')
     parser.add_argument('--password', '-p', required=True, help='SSH password')
     parser.add_argument('--neighbor', '-n', help='Specific BGP neighbor IP to check')
+    parser.add_argument('--restconf', '-r', action='store_true', help='Query BGP state over RESTCONF, falling back to SSH on failure (single host only)')
+    parser.add_argument('--concurrency', '-c', type=int, default=50, help='Maximum devices polled at once with multiple hosts (default: 50)')
     
     args = parser.parse_args()
     
+    # A semaphore of zero would never let a poll start
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
     try:
+        # Multiple hosts are polled concurrently and reported as a JSON list
+        if len(args.host) > 1:
+            import asyncio
+            
+            results = asyncio.run(run_many(
+                args.host,
+                args.username,
+                args.password,
+                args.neighbor,
+                args.concurrency
+            ))
+            print_json(results)
+            
+            # Exit code 1 if any device could not be polled
+            sys.exit(1 if any(r.get("success") is False for r in results) else 0)
+        
+        args.host = args.host[0]
+        
+        # Prefer structured RESTCONF data when requested; the SSH CLI remains the fallback
+        if args.restconf:
+            try:
+                result = get_bgp_neighbors_restconf(args.host, args.username, args.password, args.neighbor)
+                print_json(result)
+                sys.exit(0)
+            except RuntimeError as e:
+                print(f"Warning: {str(e)}; falling back to SSH", file=sys.stderr)
+        
         # Try to get BGP neighbor information
         try:
             result = get_bgp_neighbors(args.host, args.username, args.password, args.neighbor)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             sys.exit(0)
         except Exception as e:
             # Check if the error is BGP-related but not a connection issue
@@ -266,7 +1057,7 @@ def main():
                     },
                     "status": "BGP not configured or not active on this device"
                 }
-                print(json.dumps(result, indent=2))
+                print_json(result)
                 sys.exit(0)  # This is not an error condition
             else:
                 raise  # Re-raise the exception for other errors
@@ -279,7 +1070,7 @@ def main():
             "error": str(e),
             "success": False
         }
-        print(json.dumps(error_json))
+        print_json(error_json, indent=False)
         
         # Exit with code 1 on exceptions
         sys.exit(1)
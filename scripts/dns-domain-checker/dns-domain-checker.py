@@ -18,12 +18,44 @@ Exit codes:
   0 - Success (record found or not found, check output for details)
   1 - Error occurred (initiate exception handling in automation platform)
 
-Usage: python dns-domain-checker.py --hostname HOSTNAME
+Caching:
+  Lookups are cached in ~/.cache/net-tools/dns-checker.json so repeated runs skip the
+  resolver: found records for DNS_CHECKER_CACHE_TTL seconds (default: 300), missing
+  records for 30 seconds. Set DNS_CHECKER_CACHE_TTL=0 to disable the cache, e.g. when
+  waiting for a change to propagate.
+
+Daemon mode:
+  --daemon --socket PATH keeps one process running and answers lookups over a Unix
+  domain socket, so orchestrators that check hostnames in a loop pay the interpreter
+  startup once and share one in-memory cache. Each request is a hostname on its own
+  line; each reply is one "exists ip_address" line, e.g. "true 192.0.2.10" or
+  "false -". A connection may send any number of requests. Clients need no Python:
+    echo www.example.com | socat - UNIX-CONNECT:/run/dnschk.sock
+    echo www.example.com | nc -U /run/dnschk.sock
+  SIGTERM or Ctrl-C stops the daemon, removes the socket and saves the cache.
+
+Optional dependencies:
+- aiodns >= 3.1: Resolves several hostnames from one event loop with c-ares and caches each
+  record for its own DNS TTL (falls back to a thread pool over getaddrinfo)
+
+Usage: python dns-domain-checker.py --hostname HOSTNAME [HOSTNAME ...]
+       Several hostnames are resolved concurrently; each result is printed as it completes.
+       python dns-domain-checker.py --daemon --socket PATH
 """
 
 import sys
+import json
+import os
 import socket
-import argparse
+import stat
+import threading
+import time
+import types
+
+# argparse, asyncio, concurrent.futures, socketserver and aiodns are imported only on the paths that
+# use them: a single lookup is the common orchestrator call, and asyncio alone takes
+# longer to import than a cached lookup takes to run. aiodns is set by _import_aiodns().
+aiodns = None
 
 # Orchestration Integration Notes:
 # ---------------------------
@@ -40,8 +72,34 @@ import argparse
 #   - Error code separation enables automated exception handling and recovery
 #   - Designed for seamless integration in multi-stage automation sequences
 
+# Seconds a resolved record is served from the cache; 0 disables caching
+DNS_CACHE_TTL = float(os.environ.get("DNS_CHECKER_CACHE_TTL", 300))
+
+# Seconds a failed lookup is cached, kept short so new records show up quickly
+DNS_NEGATIVE_CACHE_TTL = 30
+
+# Most hostnames kept in the lookup cache; a long-running daemon evicts past this
+DNS_CACHE_MAX_ENTRIES = 10000
+
+# Upper bound on concurrent lookups when checking several hostnames
+MAX_WORKERS = 32
+
+# Cache file shared by successive runs of the script
+DNS_CACHE_PATH = os.path.expanduser("~/.cache/net-tools/dns-checker.json")
 
-def check_dns_record_exists(hostname):
+# Lookup results keyed by hostname, as [ip_address or None, expiry] pairs; expiry is
+# wall-clock time so entries stay valid across runs. Loaded from DNS_CACHE_PATH on
+# first use.
+_DNS_CACHE = None
+_DNS_CACHE_LOCK = threading.Lock()
+
+# Lookups in progress keyed by hostname, as [threading.Event, (exists, ip_address) or
+# None] pairs, so concurrent callers for one hostname share a single resolver query
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def check_dns_record_exists(hostname, persist=True):
     """
     Validate DNS record existence as a critical step in orchestrated processes.
     
@@ -54,6 +112,8 @@ def check_dns_record_exists(hostname):
         hostname (str): The hostname to verify in DNS - can include subdomains
                         and should follow RFC 1123 format. Can be dynamically
                         generated as part of automated provisioning processes.
+        persist (bool): Write the lookup cache to disk after a lookup (default: True).
+                        Batch runs pass False and save the cache once at the end.
         
     Returns:
         tuple: (exists, ip_address) where:
@@ -66,13 +126,336 @@ def check_dns_record_exists(hostname):
         - Configuration validation in multi-system automation
         - Process branching in end-to-end service orchestration
     """
-    try:
-        # Attempt to resolve the hostname
-        ip_address = socket.gethostbyname(hostname)
+    # IP literals resolve to themselves without any DNS traffic or caching
+    ip_address = _numeric_address(hostname)
+    if ip_address is not None:
         return True, ip_address
+    
+    # Serve a cached answer while it is fresh
+    entry = _cached_entry(hostname)
+    if entry is not None:
+        return entry[0] is not None, entry[0]
+    
+    # Join a lookup another thread already started for this hostname
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT.get(hostname)
+        leader = inflight is None
+        if leader:
+            inflight = _INFLIGHT[hostname] = [threading.Event(), None]
+    if not leader:
+        inflight[0].wait()
+        if inflight[1] is not None:
+            return inflight[1]
+        # The shared lookup raised; look up again so this caller sees the error too
+        return check_dns_record_exists(hostname, persist)
+    
+    try:
+        ip_address, ttl = _resolve(hostname)
+        _store_entry(hostname, ip_address, ttl, persist)
+        inflight[1] = (ip_address is not None, ip_address)
+        return inflight[1]
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[hostname]
+        inflight[0].set()
+
+
+def _resolve(hostname):
+    """Resolve hostname, returning (ip_address or None, seconds to cache the answer)."""
+    try:
+        # Attempt to resolve the hostname; AI_ADDRCONFIG skips AAAA queries on hosts
+        # without IPv6 (and A queries on hosts without IPv4)
+        ip_address = _first_address(socket.getaddrinfo(
+            hostname, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM, flags=socket.AI_ADDRCONFIG
+        ))
+        return ip_address, DNS_CACHE_TTL
     except socket.gaierror:
         # DNS resolution failed
-        return False, None
+        return None, DNS_NEGATIVE_CACHE_TTL
+
+
+async def check_dns_records_async(hostnames, on_result):
+    """
+    Check many hostnames concurrently on one event loop using aiodns.
+    
+    A and AAAA lookups go through c-ares, which also reads the hosts file. Found
+    records are cached for their DNS TTL, capped at DNS_CACHE_TTL. IPv4 addresses
+    are reported ahead of IPv6 ones, as gethostbyname did.
+    
+    Args:
+        hostnames (list): Hostnames to verify in DNS
+        on_result (callable): Called as on_result(hostname, exists, ip_address) as each
+                              lookup completes
+    """
+    import asyncio
+    
+    resolver = aiodns.DNSResolver()
+    
+    async def lookup_address(hostname):
+        ip_address = _numeric_address(hostname)
+        if ip_address is not None:
+            return ip_address
+        
+        entry = _cached_entry(hostname)
+        if entry is not None:
+            return entry[0]
+        
+        try:
+            result = await resolver.getaddrinfo(hostname, family=socket.AF_UNSPEC)
+            nodes = sorted(result.nodes, key=lambda node: node.family != socket.AF_INET)
+            ip_address = nodes[0].addr[0]
+            if isinstance(ip_address, bytes):
+                ip_address = ip_address.decode()
+            ttl = min(node.ttl for node in nodes)
+        except (aiodns.error.DNSError, IndexError):
+            # DNS resolution failed
+            ip_address = None
+            ttl = DNS_NEGATIVE_CACHE_TTL
+        
+        _store_entry(hostname, ip_address, ttl, persist=False)
+        return ip_address
+    
+    async def check(hostname):
+        try:
+            return hostname, await lookup_address(hostname)
+        except ValueError:
+            # Names the resolvers cannot encode, e.g. with a NUL or an overlong label
+            return hostname, None
+    
+    for lookup in asyncio.as_completed([check(hostname) for hostname in hostnames]):
+        hostname, ip_address = await lookup
+        on_result(hostname, ip_address is not None, ip_address)
+
+
+def _import_aiodns():
+    """Import aiodns for a batch run, returning the module or None when it is not installed or too old."""
+    global aiodns
+    try:
+        # aiodns (c-ares) runs many lookups on one event loop and reports record TTLs
+        import aiodns
+    except ImportError:
+        aiodns = None
+    
+    # DNSResolver.getaddrinfo first appeared in aiodns 3.1; older releases use the thread pool
+    if aiodns is not None and not hasattr(aiodns.DNSResolver, "getaddrinfo"):
+        aiodns = None
+    return aiodns
+
+
+def _numeric_address(hostname):
+    """Return the address when hostname is an IP literal, otherwise None."""
+    try:
+        return _first_address(socket.getaddrinfo(hostname, None, flags=socket.AI_NUMERICHOST))
+    except socket.gaierror:
+        return None
+
+
+def _first_address(addrinfo):
+    """Return the first IPv4 address among getaddrinfo() results, as gethostbyname did, else the first address."""
+    return min(addrinfo, key=lambda info: info[0] != socket.AF_INET)[4][0]
+
+
+def _cached_entry(hostname):
+    """Return the fresh [ip_address or None, expiry] cache entry for hostname, or None."""
+    entry = _load_dns_cache().get(hostname)
+    if entry is not None and time.time() < entry[1]:
+        return entry
+    return None
+
+
+def _store_entry(hostname, ip_address, ttl, persist=True):
+    """Cache a lookup result for ttl seconds, capped at DNS_CACHE_TTL; nothing is stored when 0."""
+    ttl = min(ttl, DNS_CACHE_TTL)
+    if ttl > 0:
+        cache = _load_dns_cache()
+        with _DNS_CACHE_LOCK:
+            cache[hostname] = [ip_address, time.time() + ttl]
+            if len(cache) > DNS_CACHE_MAX_ENTRIES:
+                _prune_dns_cache(cache)
+        if persist:
+            _save_dns_cache()
+
+
+def _prune_dns_cache(cache):
+    """
+    Shrink an over-full lookup cache in place, dropping expired entries first.
+    
+    The entries closest to expiry then go too, down to three quarters of
+    DNS_CACHE_MAX_ENTRIES, so the next prune is many stores away.
+    Callers hold _DNS_CACHE_LOCK.
+    
+    Args:
+        cache (dict): Lookup cache keyed by hostname, as [ip_address or None, expiry] pairs
+    """
+    now = time.time()
+    for name in [name for name, entry in cache.items() if entry[1] <= now]:
+        del cache[name]
+    
+    excess = len(cache) - DNS_CACHE_MAX_ENTRIES * 3 // 4
+    if excess > 0:
+        for name in sorted(cache, key=lambda name: cache[name][1])[:excess]:
+            del cache[name]
+
+
+def _load_dns_cache():
+    """Return the lookup cache, reading unexpired entries from DNS_CACHE_PATH on first use."""
+    global _DNS_CACHE
+    if _DNS_CACHE is None:
+        _DNS_CACHE = {}
+        if DNS_CACHE_TTL > 0:
+            try:
+                with open(DNS_CACHE_PATH) as f:
+                    entries = json.load(f)
+                now = time.time()
+                _DNS_CACHE = {name: entry for name, entry in entries.items() if now < entry[1]}
+                if len(_DNS_CACHE) > DNS_CACHE_MAX_ENTRIES:
+                    _prune_dns_cache(_DNS_CACHE)
+            except (OSError, ValueError, TypeError, IndexError, AttributeError):
+                # A missing or unreadable cache file just means a cold cache
+                pass
+    return _DNS_CACHE
+
+
+def _save_dns_cache():
+    """Write the lookup cache to DNS_CACHE_PATH; failures only cost the next run a lookup."""
+    # Nothing was looked up or loaded, so the file on disk is already current
+    if _DNS_CACHE is None:
+        return
+    
+    # Snapshot the unexpired entries so daemon threads can keep storing while this writes
+    now = time.time()
+    with _DNS_CACHE_LOCK:
+        entries = {name: entry for name, entry in _DNS_CACHE.items() if now < entry[1]}
+    
+    try:
+        os.makedirs(os.path.dirname(DNS_CACHE_PATH), exist_ok=True)
+        
+        # Write a temporary file and rename it so a concurrent run never reads a partial file
+        temp_path = f"{DNS_CACHE_PATH}.{os.getpid()}"
+        with open(temp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(temp_path, DNS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def serve_dns_checks(socket_path):
+    """
+    Answer lookups over a Unix domain socket until the process is stopped.
+    
+    Every connection is served on its own thread and all of them share the in-memory
+    lookup cache, which is written to DNS_CACHE_PATH when the daemon stops. See
+    "Daemon mode" in the module docstring for the line protocol.
+    
+    Args:
+        socket_path (str): Path of the Unix domain socket to listen on
+    """
+    import signal
+    import socketserver
+    
+    class DnsCheckHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                for line in self.rfile:
+                    hostname = line.decode(errors="replace").strip()
+                    if not hostname:
+                        continue
+                    try:
+                        exists, ip_address = check_dns_record_exists(hostname, persist=False)
+                    except ValueError:
+                        # Names getaddrinfo cannot encode, e.g. with a NUL or an overlong label
+                        exists, ip_address = False, None
+                    self.wfile.write(f"{'true' if exists else 'false'} {ip_address or '-'}\n".encode())
+            except (BrokenPipeError, ConnectionResetError):
+                # The client went away before reading every reply
+                pass
+    
+    # Load the cache before any handler thread can race to do it
+    _load_dns_cache()
+    
+    _remove_stale_socket(socket_path)
+    server = socketserver.ThreadingUnixStreamServer(socket_path, DnsCheckHandler)
+    server.daemon_threads = True
+    
+    # Turn SIGTERM into SystemExit so the cleanup below also runs under a service manager
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+        _save_dns_cache()
+
+
+def _remove_stale_socket(socket_path):
+    """Remove a socket left by a daemon that did not shut down cleanly; fail if one is live."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        # Nothing listens on it any more; never remove anything that is not a socket
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+            return
+        raise RuntimeError(f"{socket_path} exists and is not a socket")
+    finally:
+        probe.close()
+    raise RuntimeError(f"Another process is already listening on {socket_path}")
+
+
+def print_result(hostname, exists, ip_address):
+    """
+    Print the text result for one hostname.
+    
+    Args:
+        hostname (str): The hostname that was checked
+        exists (bool): Whether a DNS record was found
+        ip_address (str): Resolved IP address, or None
+    """
+    if exists:
+        print(f"DNS record for {hostname} exists.")
+        if ip_address:
+            print(f"IP address: {ip_address}")
+    else:
+        print(f"DNS record for {hostname} does not exist.")
+
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
+    
+    The usual "--hostname HOSTNAME [HOSTNAME ...]" call is parsed by hand, since
+    importing argparse and building a parser costs more than a cached lookup. --help,
+    errors, daemon mode and any other spelling of the options go through argparse.
+    
+    Args:
+        argv (list): Command-line arguments, without the program name
+        
+    Returns:
+        namespace: Parsed options with hostname, daemon and socket attributes
+    """
+    if len(argv) > 1 and argv[0] in ("--hostname", "-H") and not any(arg.startswith("-") for arg in argv[1:]):
+        return types.SimpleNamespace(hostname=argv[1:], daemon=False, socket=None)
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Check if a DNS record exists for a hostname')
+    parser.add_argument('--hostname', '-H', nargs='+', help='Hostname(s) to check')
+    parser.add_argument('--daemon', action='store_true', help='Serve lookups over a Unix domain socket instead')
+    parser.add_argument('--socket', help='Unix domain socket path for --daemon')
+    
+    args = parser.parse_args(argv)
+    
+    if args.daemon and not args.socket:
+        parser.error("--daemon requires --socket")
+    if not args.daemon and not args.hostname:
+        parser.error("the following arguments are required: --hostname/-H")
+    
+    return args
 
 
 def main():
@@ -89,22 +472,41 @@ def main():
     - Human-readable text output
     - Orchestration-ready exit codes for dynamic process flow control
     """
-    parser = argparse.ArgumentParser(description='Check if a DNS record exists for a hostname')
-    parser.add_argument('--hostname', '-H', required=True, help='Hostname to check')
-    
-    args = parser.parse_args()
-    
-    hostname = args.hostname
-    
-    exists, ip_address = check_dns_record_exists(hostname)
+    args = parse_args(sys.argv[1:])
+    hostnames = args.hostname
     
-    # Print the text result
-    if exists:
-        print(f"DNS record for {hostname} exists.")
-        if ip_address:
-            print(f"IP address: {ip_address}")
+    if args.daemon:
+        serve_dns_checks(args.socket)
+    elif len(hostnames) == 1:
+        hostname = hostnames[0]
+        print_result(hostname, *check_dns_record_exists(hostname))
+    elif _import_aiodns() is not None:
+        import asyncio
+        
+        # One event loop issues every query; the cache is loaded up front and written
+        # once at the end
+        _load_dns_cache()
+        asyncio.run(check_dns_records_async(hostnames, print_result))
+        _save_dns_cache()
     else:
-        print(f"DNS record for {hostname} does not exist.")
+        import concurrent.futures
+        
+        # Lookups block on network I/O, so threads resolve the hostnames in parallel;
+        # the cache is loaded up front and written once when all lookups are done
+        _load_dns_cache()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(hostnames))) as executor:
+            futures = {
+                executor.submit(check_dns_record_exists, hostname, False): hostname
+                for hostname in hostnames
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    exists, ip_address = future.result()
+                except ValueError:
+                    # Names getaddrinfo cannot encode, e.g. with a NUL or an overlong label
+                    exists, ip_address = False, None
+                print_result(futures[future], exists, ip_address)
+        _save_dns_cache()
     
     # Exit code 0 for normal operation regardless of DNS record status
     # The existence of the record is communicated via the text output
@@ -15,6 +15,10 @@ Automation use cases:
 Output format:
 - JSON: Structured output for automation systems
 
+Optional dependencies:
+- orjson: Faster JSON output for large results (falls back to json; non-ASCII text is
+  written as raw UTF-8 rather than \\u escapes)
+
 Parameters:
   --host HOST - Target Juniper JUNOS device hostname or IP
   --username USERNAME - NETCONF username
@@ -22,6 +26,7 @@ Parameters:
   --port PORT - NETCONF port (default: 830)
   --instance INSTANCE - OSPF routing-instance (default: master)
   --area AREA - Specific OSPF area to check
+  --serve [HOST]:PORT - Run as an HTTP exporter instead of printing one result (see below)
 
 Exit codes:
   0 - Success
@@ -33,16 +38,172 @@ Usage examples:
 
   Check specific OSPF area:
     python juniper-junos-ospf-status.py --host 10.1.1.1 --username admin --password juniper --area 0.0.0.0
+
+Exporter mode:
+  With --serve the script keeps running and polls the device on every request, over one
+  NETCONF session that stays open between polls:
+    GET /ospf     - The JSON result printed by a normal run (HTTP 502 with the error JSON
+                    when the poll fails)
+    GET /metrics  - Neighbor counts and per-neighbor Full state in the Prometheus text
+                    format, plus junos_ospf_up (0 when the poll fails)
+  Requests that arrive while a poll is running share its result instead of sending
+  another RPC. SIGTERM stops the exporter and closes the session.
+
+    python juniper-junos-ospf-status.py --host 10.1.1.1 --username admin --password juniper --serve :9100
+
+  A systemd unit for one device, e.g. /etc/systemd/system/junos-ospf-exporter@.service
+  started as junos-ospf-exporter@10.1.1.1:
+
+    [Unit]
+    Description=Juniper OSPF exporter for %i
+    After=network-online.target
+
+    [Service]
+    ExecStart=/usr/bin/python3 /opt/scripts/juniper-junos-ospf-status/juniper-junos-ospf-status.py \\
+        --host %i --username monitor --password secret --serve 127.0.0.1:9100
+    Restart=on-failure
+    DynamicUser=yes
+
+    [Install]
+    WantedBy=multi-user.target
 """
 
 import sys
 import json
 import argparse
+import atexit
+import collections
+import dataclasses
 import datetime
+import http.server
+import signal
+import threading
+import time
 from jnpr.junos import Device
-from lxml import etree
+from jnpr.junos.exception import ConnectClosedError
+from ncclient.transport.errors import TransportError
+
+try:
+    # orjson serializes large results several times faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+# Open devices keyed by (host, port, username), as [device, last used monotonic time]
+# pairs; only used with keep_alive, i.e. by the --serve exporter
+_DEVICE_POOL = {}
+_DEVICE_POOL_LOCK = threading.Lock()
+
+# Seconds a pooled device may sit idle before its session is closed
+DEVICE_IDLE_TIMEOUT = 300
+
+# Device details keyed by (host, port), as (monotonic timestamp, device_info) pairs
+_DEVICE_INFO_CACHE = {}
+
+# Seconds before cached device details are queried again
+DEVICE_INFO_TTL = 3600
+
+# Errors meaning the NETCONF session itself is gone, so a pooled device is reopened
+_SESSION_ERRORS = (ConnectClosedError, TransportError, EOFError, OSError)
+
+
+@dataclasses.dataclass
+class OspfNeighbor:
+    """One neighbor entry of the report, serialized as a JSON object by print_json."""
+    __slots__ = (
+        "neighbor_id", "neighbor_address", "interface", "state", "area", "adjacency_time", "dead_time"
+    )
+    neighbor_id: str
+    neighbor_address: str
+    interface: str
+    state: str
+    area: str
+    adjacency_time: str
+    dead_time: str
+
+
+# Position in OspfNeighbor's field order of each child element read from a neighbor,
+# so one pass over its children fills every field
+_NEIGHBOR_FIELD_INDEX = {
+    tag: index
+    for index, tag in enumerate((
+        "neighbor-id",
+        "neighbor-address",
+        "interface-name",
+        "ospf-neighbor-state",
+        "ospf-area",
+        "neighbor-adjacency-time",
+        "ospf-neighbor-dead-time",
+    ))
+}
+
+
+def _get_device(host, username, password, port):
+    """
+    Return an open device from the pool, opening a new session when none is usable.
+    
+    Pooled sessions idle for longer than DEVICE_IDLE_TIMEOUT are closed on the way.
+    
+    Args:
+        host (str): Hostname or IP address of the Juniper device
+        username (str): NETCONF username
+        password (str): NETCONF password
+        port (int): NETCONF port
+        
+    Returns:
+        jnpr.junos.Device: Open device, owned by the pool
+    """
+    key = (host, port, username)
+    now = time.monotonic()
+    with _DEVICE_POOL_LOCK:
+        # Reap idle sessions, including this device's when it is stale
+        for pool_key, (dev, last_used) in list(_DEVICE_POOL.items()):
+            if now - last_used >= DEVICE_IDLE_TIMEOUT or not dev.connected:
+                del _DEVICE_POOL[pool_key]
+                _close_device(dev)
+        
+        entry = _DEVICE_POOL.get(key)
+        if entry is not None:
+            entry[1] = now
+            return entry[0]
+        
+        dev = Device(host=host, user=username, passwd=password, port=port, gather_facts=False)
+        dev.open()
+        _DEVICE_POOL[key] = [dev, now]
+        return dev
+
 
-def get_ospf_neighbors(host, username, password, port=830, instance="master", area=None):
+def _discard_device(host, username, port):
+    """Drop and close the pooled device, if any."""
+    with _DEVICE_POOL_LOCK:
+        entry = _DEVICE_POOL.pop((host, port, username), None)
+    if entry is not None:
+        _close_device(entry[0])
+
+
+def _close_device(dev):
+    """Close a device session, ignoring errors from an already broken session."""
+    try:
+        dev.close()
+    except Exception:
+        pass
+
+
+@atexit.register
+def _close_pooled_devices():
+    """Close every pooled device session at interpreter exit."""
+    with _DEVICE_POOL_LOCK:
+        for dev, last_used in _DEVICE_POOL.values():
+            _close_device(dev)
+        _DEVICE_POOL.clear()
+
+
+def utc_timestamp():
+    """Return the current UTC time as an ISO 8601 string with second precision."""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+
+
+def get_ospf_neighbors(host, username, password, port=830, instance="master", area=None, keep_alive=False):
     """
     Connect to a Juniper JUNOS device and retrieve OSPF neighbor status.
     
@@ -53,9 +214,12 @@ def get_ospf_neighbors(host, username, password, port=830, instance="master", ar
         port (int): NETCONF port (default: 830)
         instance (str): Routing instance name (default: master)
         area (str): OSPF area ID to filter by (optional)
+        keep_alive (bool): Reuse a pooled NETCONF session across calls instead of
+                           opening and closing one per call (default: False)
         
     Returns:
-        dict: Structured OSPF neighbor data with the following format:
+        dict: Structured OSPF neighbor data with the following format, where each
+              entry of "neighbors" is an OspfNeighbor record:
               {
                 "device": {
                   "hostname": "ROUTER1",
@@ -63,7 +227,7 @@ def get_ospf_neighbors(host, username, password, port=830, instance="master", ar
                   "model": "MX480",
                   "version": "20.4R3"
                 },
-                "timestamp": "2025-05-07T10:15:30",
+                "timestamp": "2025-05-07T10:15:30+00:00",
                 "ospf_instance": "master",
                 "neighbors": [
                   {
@@ -85,88 +249,394 @@ def get_ospf_neighbors(host, username, password, port=830, instance="master", ar
                 }
               }
     """
+    device_info, reply = fetch_ospf_neighbors(host, username, password, port, instance, area, keep_alive)
+    
     try:
-        # Connect to the Juniper device
-        dev = Device(host=host, user=username, passwd=password, port=port)
-        dev.open()
+        return build_ospf_result(device_info, instance, reply)
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve OSPF neighbor information: {str(e)}")
+
+
+def fetch_ospf_neighbors(host, username, password, port=830, instance="master", area=None, keep_alive=False):
+    """
+    Connect to a Juniper JUNOS device and fetch its details and OSPF neighbor reply.
+    
+    Args:
+        host (str): Hostname or IP address of the Juniper device
+        username (str): NETCONF username
+        password (str): NETCONF password
+        port (int): NETCONF port (default: 830)
+        instance (str): Routing instance name (default: master)
+        area (str): OSPF area ID to filter by (optional)
+        keep_alive (bool): Reuse a pooled NETCONF session across calls instead of
+                           opening and closing one per call (default: False)
         
-        # Get device information
-        device_info = {
-            "hostname": dev.facts["hostname"],
-            "platform": "Juniper JUNOS",
-            "model": dev.facts["model"],
-            "version": dev.facts["version"]
-        }
+    Returns:
+        tuple: (device_info, reply) where device_info is the device details dict and
+               reply is the get-ospf-neighbor-information reply element
+    """
+    try:
+        if not keep_alive:
+            # Connect to the Juniper device for this call only; PyEZ fact gathering
+            # is skipped since only three details are needed
+            dev = Device(host=host, user=username, passwd=password, port=port, gather_facts=False)
+            dev.open()
+            try:
+                return _query_ospf_neighbors(dev, host, port, instance, area)
+            finally:
+                # Close the connection
+                dev.close()
         
-        # Construct OSPF RPC command
-        if area:
-            rpc = dev.rpc.get_ospf_neighbor_information(instance=instance, area=area, extensive=True)
-        else:
-            rpc = dev.rpc.get_ospf_neighbor_information(instance=instance, extensive=True)
-        
-        # Parse OSPF neighbor information
-        neighbors = []
-        areas = set()
-        full_state_count = 0
-        non_full_state_count = 0
-        
-        # Process neighbor entries
-        for nbr in rpc.findall(".//ospf-neighbor"):
-            neighbor_id = nbr.findtext("neighbor-id")
-            neighbor_address = nbr.findtext("neighbor-address")
-            interface = nbr.findtext("interface-name")
-            state = nbr.findtext("ospf-neighbor-state")
-            ospf_area = nbr.findtext("ospf-area")
-            adjacency_time = nbr.findtext("neighbor-adjacency-time")
-            dead_time = nbr.findtext("ospf-neighbor-dead-time")
-            
-            # Update counters
-            areas.add(ospf_area)
-            if state == "Full":
-                full_state_count += 1
-            else:
-                non_full_state_count += 1
-            
-            # Create neighbor entry
-            neighbor_info = {
-                "neighbor_id": neighbor_id,
-                "neighbor_address": neighbor_address,
-                "interface": interface,
-                "state": state,
-                "area": ospf_area,
-                "adjacency_time": adjacency_time,
-                "dead_time": dead_time
-            }
-            
-            neighbors.append(neighbor_info)
-        
-        # Create summary
-        summary = {
-            "total_neighbors": len(neighbors),
-            "full_state_neighbors": full_state_count,
-            "non_full_state_neighbors": non_full_state_count,
-            "areas": list(areas)
-        }
+        dev = _get_device(host, username, password, port)
+        try:
+            return _query_ospf_neighbors(dev, host, port, instance, area)
+        except _SESSION_ERRORS:
+            # The device may have dropped the pooled session; reopen it and retry once
+            _discard_device(host, username, port)
+            dev = _get_device(host, username, password, port)
+            return _query_ospf_neighbors(dev, host, port, instance, area)
         
-        # Get current timestamp
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    except Exception as e:
+        raise RuntimeError(f"Failed to retrieve OSPF neighbor information: {str(e)}")
+
+
+def _get_device_info(dev, host, port):
+    """
+    Return the device details, from cache or from a single get-software-information RPC.
+    
+    Args:
+        dev (jnpr.junos.Device): Open device
+        host (str): Hostname or IP address of the device, part of the cache key
+        port (int): NETCONF port, part of the cache key
         
-        # Close the connection
-        dev.close()
+    Returns:
+        dict: Device hostname, platform, model and version
+    """
+    key = (host, port)
+    entry = _DEVICE_INFO_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < DEVICE_INFO_TTL:
+        return entry[1]
+    
+    # On multi-RE systems the reply holds one software-information per Routing Engine;
+    # the first one describes the chassis
+    reply = dev.rpc.get_software_information()
+    software_info = reply if reply.tag == "software-information" else reply.find(".//software-information")
+    if software_info is None:
+        software_info = reply
+    
+    model = software_info.findtext("product-model")
+    device_info = {
+        "hostname": software_info.findtext("host-name"),
+        "platform": "Juniper JUNOS",
+        "model": model.upper() if model is not None else None,
+        "version": software_info.findtext("junos-version")
+    }
+    
+    _DEVICE_INFO_CACHE[key] = (time.monotonic(), device_info)
+    return device_info
+
+
+def _query_ospf_neighbors(dev, host, port, instance, area):
+    """
+    Fetch the device details and OSPF neighbor reply over an open device session.
+    
+    Args:
+        dev (jnpr.junos.Device): Open device
+        host (str): Hostname or IP address of the device
+        port (int): NETCONF port
+        instance (str): Routing instance name
+        area (str): OSPF area ID to filter by (optional)
         
-        # Create the result structure
-        result = {
-            "device": device_info,
-            "timestamp": timestamp,
-            "ospf_instance": instance,
-            "neighbors": neighbors,
-            "summary": summary
-        }
+    Returns:
+        tuple: (device_info, reply), as returned by fetch_ospf_neighbors
+    """
+    # Get device information
+    device_info = _get_device_info(dev, host, port)
+    
+    # Construct OSPF RPC command; "detail" already carries every field parsed below,
+    # without the per-neighbor extras "extensive" renders and sends
+    if area:
+        rpc = dev.rpc.get_ospf_neighbor_information(instance=instance, area=area, detail=True)
+    else:
+        rpc = dev.rpc.get_ospf_neighbor_information(instance=instance, detail=True)
+    
+    return device_info, rpc
+
+
+def iter_ospf_neighbors(reply):
+    """
+    Parse OSPF neighbor entries from a get-ospf-neighbor-information reply.
+    
+    The reply is consumed as it is read: each neighbor subtree is cleared once its
+    fields are read, and the emptied element is detached from the reply when the
+    walk moves past it.
+    
+    Args:
+        reply (lxml.etree._Element): RPC reply, as returned by fetch_ospf_neighbors
+        
+    Yields:
+        OspfNeighbor: One record per neighbor; missing fields are None
+    """
+    # State, area and interface repeat across neighbors; equal values share one string
+    shared = {}
+    
+    # iter() matches the tag in C without evaluating a path
+    for nbr in reply.iter("ospf-neighbor"):
+        # Missing or empty children leave a field None; the first child with text wins
+        values = [None] * len(_NEIGHBOR_FIELD_INDEX)
+        for child in nbr:
+            index = _NEIGHBOR_FIELD_INDEX.get(child.tag)
+            if index is not None and values[index] is None:
+                values[index] = child.text
+        neighbor = OspfNeighbor(*values)
+        nbr.clear()
         
-        return result
+        # Everything before the current element has already been walked
+        previous = nbr.getprevious()
+        if previous is not None:
+            nbr.getparent().remove(previous)
         
-    except Exception as e:
-        raise RuntimeError(f"Failed to retrieve OSPF neighbor information: {str(e)}")
+        neighbor.state = shared.setdefault(neighbor.state, neighbor.state)
+        neighbor.area = shared.setdefault(neighbor.area, neighbor.area)
+        neighbor.interface = shared.setdefault(neighbor.interface, neighbor.interface)
+        yield neighbor
+
+
+def _build_summary(states, areas):
+    """Build the summary from a Counter of neighbor states and the set of areas."""
+    total = sum(states.values())
+    return {
+        "total_neighbors": total,
+        "full_state_neighbors": states["Full"],
+        "non_full_state_neighbors": total - states["Full"],
+        "areas": list(areas)
+    }
+
+
+def build_ospf_result(device_info, instance, reply):
+    """
+    Build the OSPF neighbor status result from a fetched reply.
+    
+    Args:
+        device_info (dict): Device details, as returned by fetch_ospf_neighbors
+        instance (str): Routing instance name
+        reply (lxml.etree._Element): RPC reply, as returned by fetch_ospf_neighbors
+        
+    Returns:
+        dict: Structured OSPF neighbor data (see get_ospf_neighbors for the schema)
+    """
+    # Parse OSPF neighbor information
+    neighbors = list(iter_ospf_neighbors(reply))
+    
+    # Count states and collect areas after the parse
+    states = collections.Counter(neighbor.state for neighbor in neighbors)
+    areas = {neighbor.area for neighbor in neighbors}
+    
+    # Get current timestamp
+    timestamp = utc_timestamp()
+    
+    # Create the result structure
+    result = {
+        "device": device_info,
+        "timestamp": timestamp,
+        "ospf_instance": instance,
+        "neighbors": neighbors,
+        "summary": _build_summary(states, areas)
+    }
+    
+    return result
+
+
+def _record_fields(obj):
+    """json.dumps default hook turning slotted records into dicts."""
+    if isinstance(obj, OspfNeighbor):
+        return {field: getattr(obj, field) for field in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def print_json(data, indent=True):
+    """
+    Write data to stdout as JSON, using orjson when it is installed.
+    
+    orjson writes non-ASCII text such as descriptions as raw UTF-8 where json
+    escapes it (e.g. \\u00e9), so consumers must read the output as UTF-8.
+    
+    Args:
+        data: JSON-serializable result; OspfNeighbor records become objects
+        indent (bool): Indent with two spaces (default: True)
+    """
+    if orjson is None:
+        print(json.dumps(data, indent=2 if indent else None, default=_record_fields))
+        return
+    
+    # Flush pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _encode_indented(data):
+    """Encode data as two-space indented JSON bytes, with orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(data, indent=2, default=_record_fields).encode()
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def print_ospf_result(device_info, instance, reply):
+    """
+    Write the OSPF result to stdout, encoding each neighbor as soon as it is parsed.
+    
+    The output is identical to print_json(build_ospf_result(...)), but neither the
+    neighbor list nor the whole JSON document is held in memory.
+    
+    Args:
+        device_info (dict): Device details, as returned by fetch_ospf_neighbors
+        instance (str): Routing instance name
+        reply (lxml.etree._Element): RPC reply, as returned by fetch_ospf_neighbors
+    """
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    
+    # Get current timestamp
+    timestamp = utc_timestamp()
+    
+    # Open the document: the header object without its closing "\n}"
+    header = _encode_indented({"device": device_info, "timestamp": timestamp, "ospf_instance": instance})
+    out.write(header[:-2] + b',\n  "neighbors": [')
+    
+    # Neighbors are nested two levels deep in the document
+    states = collections.Counter()
+    areas = set()
+    separator = b"\n    "
+    for neighbor in iter_ospf_neighbors(reply):
+        out.write(separator + _encode_indented(neighbor).replace(b"\n", b"\n    "))
+        separator = b",\n    "
+        states[neighbor.state] += 1
+        areas.add(neighbor.area)
+    out.write(b"\n  ]" if states else b"]")
+    
+    # Close with the summary: its object without the opening "{\n"
+    summary = _encode_indented({"summary": _build_summary(states, areas)})
+    out.write(b",\n" + summary[2:] + b"\n")
+    out.flush()
+
+
+def serve_ospf(address, host, username, password, port=830, instance="master", area=None):
+    """
+    Serve OSPF neighbor status over HTTP until the process is stopped.
+    
+    See "Exporter mode" in the module docstring for the endpoints.
+    
+    Args:
+        address (str): Listen address as [HOST]:PORT; an empty HOST listens on all interfaces
+        host (str): Hostname or IP address of the Juniper device
+        username (str): NETCONF username
+        password (str): NETCONF password
+        port (int): NETCONF port (default: 830)
+        instance (str): Routing instance name (default: master)
+        area (str): OSPF area ID to filter by (optional)
+    """
+    listen_host, _, listen_port = address.rpartition(":")
+    
+    # Completed monotonic time and (result, error) of the latest poll
+    poll_lock = threading.Lock()
+    last_poll = [float("-inf"), (None, None)]
+    
+    def poll():
+        """Poll the device, or share the result of a poll that finished after this call began."""
+        requested = time.monotonic()
+        with poll_lock:
+            if last_poll[0] < requested:
+                try:
+                    outcome = (get_ospf_neighbors(host, username, password, port, instance, area, keep_alive=True), None)
+                except Exception as e:
+                    outcome = (None, str(e))
+                last_poll[:] = [time.monotonic(), outcome]
+            return last_poll[1]
+    
+    class OspfRequestHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/ospf":
+                result, error = poll()
+                if error is None:
+                    status, body = 200, _encode_indented(result)
+                else:
+                    status, body = 502, _encode_indented({"error": error, "success": False})
+                content_type = "application/json"
+            elif path == "/metrics":
+                result, error = poll()
+                status, body = 200, format_ospf_metrics(result, instance).encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    server = http.server.ThreadingHTTPServer((listen_host, int(listen_port)), OspfRequestHandler)
+    server.daemon_threads = True
+    
+    # Turn SIGTERM into SystemExit so the pooled session is closed at exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def format_ospf_metrics(result, instance):
+    """
+    Render an OSPF result in the Prometheus text exposition format.
+    
+    Args:
+        result (dict): Result from get_ospf_neighbors, or None when the poll failed
+        instance (str): Routing instance name, exported as the routing_instance label
+        
+    Returns:
+        str: Metrics text
+    """
+    lines = [
+        "# HELP junos_ospf_up Whether the last poll of the device succeeded.",
+        "# TYPE junos_ospf_up gauge",
+        f"junos_ospf_up {0 if result is None else 1}",
+    ]
+    if result is None:
+        return "\n".join(lines) + "\n"
+    
+    summary = result["summary"]
+    labels = f'routing_instance="{_label_value(instance)}"'
+    lines += [
+        "# HELP junos_ospf_neighbors OSPF neighbors.",
+        "# TYPE junos_ospf_neighbors gauge",
+        f"junos_ospf_neighbors{{{labels}}} {summary['total_neighbors']}",
+        "# HELP junos_ospf_full_neighbors OSPF neighbors in the Full state.",
+        "# TYPE junos_ospf_full_neighbors gauge",
+        f"junos_ospf_full_neighbors{{{labels}}} {summary['full_state_neighbors']}",
+        "# HELP junos_ospf_neighbor_full Whether the OSPF neighbor is in the Full state.",
+        "# TYPE junos_ospf_neighbor_full gauge",
+    ]
+    for neighbor in result["neighbors"]:
+        lines.append(
+            f'junos_ospf_neighbor_full{{{labels},neighbor_id="{_label_value(neighbor.neighbor_id)}",'
+            f'neighbor_address="{_label_value(neighbor.neighbor_address)}",'
+            f'interface="{_label_value(neighbor.interface)}",area="{_label_value(neighbor.area)}"}} '
+            f'{1 if neighbor.state == "Full" else 0}'
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _label_value(value):
+    """Escape a Prometheus label value; None becomes an empty string."""
+    if value is None:
+        return ""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
 
 def main():
@@ -178,12 +648,17 @@ def main():
     parser.add_argument('--port', '-P', type=int, default=830, help='NETCONF port (default: 830)')
     parser.add_argument('--instance', '-i', default='master', help='OSPF routing-instance (default: master)')
     parser.add_argument('--area', '-a', help='Specific OSPF area to check')
+    parser.add_argument('--serve', metavar='[HOST]:PORT', help='Serve /ospf and /metrics over HTTP on this address instead of printing one result')
     
     args = parser.parse_args()
     
     try:
+        if args.serve:
+            serve_ospf(args.serve, args.host, args.username, args.password, args.port, args.instance, args.area)
+            sys.exit(0)
+        
         # Get OSPF neighbor data
-        result = get_ospf_neighbors(
+        device_info, reply = fetch_ospf_neighbors(
             args.host, 
             args.username, 
             args.password,
@@ -192,8 +667,9 @@ def main():
             args.area
         )
         
-        # Always output as JSON for automation consumption
-        print(json.dumps(result, indent=2))
+        # Always output as JSON for automation consumption; neighbors are written
+        # as they are parsed
+        print_ospf_result(device_info, args.instance, reply)
         
         # Exit code 0 for successful operation
         sys.exit(0)
@@ -207,7 +683,7 @@ def main():
             "error": str(e),
             "success": False
         }
-        print(json.dumps(error_json))
+        print_json(error_json, indent=False)
         
         # Exit with code 1 on exceptions
         sys.exit(1)